@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from decimal import Decimal
+from typing import Any
 
-from sqlalchemy import delete
+from sqlalchemy import Table, delete, event, insert, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -19,206 +22,166 @@ from nodepragagent.db.models import (
     Supplier,
 )
 
-from nodepragagent.tools import create_postgres_engine
+from nodepragagent.db import get_engine
+
+import seed_data
+
+# Ordered so that dependent rows are removed before the rows they reference.
+_SEEDED_TABLES = [
+    Purchase.__table__,
+    ItemSupplier.__table__,
+    CustomerAddress.__table__,
+    Customer.__table__,
+    Item.__table__,
+    Supplier.__table__,
+    Category.__table__,
+]
+
+
+def _relax_sqlite_durability(engine: Engine) -> None:
+    """Skip fsync and on-disk journaling for SQLite while seeding throwaway data."""
+
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:  # type: ignore[no-untyped-def]
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.close()
+
+
+def _insert_returning_ids(session: Session, model: type[Base], rows: list[dict]) -> list[int]:
+    """Bulk insert ``rows`` in one statement and return the new primary keys in order."""
+
+    statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return list(session.execute(statement, rows).scalars())
+
+
+def _insert_rows(session: Session, model: type[Base], rows: list[dict[str, Any]]) -> None:
+    """Insert rows whose primary keys are not needed, via COPY with psycopg 3."""
+
+    if not rows:
+        return
+
+    # ``cursor.copy`` is psycopg 3 API; psycopg2 and other drivers use executemany.
+    dialect = session.get_bind().dialect
+    if dialect.name != "postgresql" or dialect.driver != "psycopg":
+        session.execute(insert(model), rows)
+        return
+
+    table: Table = model.__table__  # type: ignore[assignment]
+    columns = list(rows[0])
+    copy_sql = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN"
+    # Reuse the session's connection so COPY runs inside the seeding transaction.
+    dbapi_connection = session.connection().connection.driver_connection
+    with dbapi_connection.cursor() as cursor:  # type: ignore[union-attr]
+        with cursor.copy(copy_sql) as copy:
+            for row in rows:
+                copy.write_row([row[column] for column in columns])
+
+
+def _from_cents(cents: int) -> Decimal:
+    """Convert an integer amount of cents into a two-decimal ``Decimal``."""
+
+    return Decimal(cents).scaleb(-2)
+
+
+def _clear_tables(session: Session) -> None:
+    """Remove all seeded rows, using a single TRUNCATE when running on PostgreSQL."""
+
+    if session.get_bind().dialect.name == "postgresql":
+        table_names = ", ".join(table.name for table in _SEEDED_TABLES)
+        session.execute(text(f"TRUNCATE TABLE {table_names} RESTART IDENTITY CASCADE"))
+        return
+
+    for table in _SEEDED_TABLES:
+        session.execute(delete(table))
 
 
 def load_dummy_data(session: Session) -> None:
     """Insert a deterministic set of customers, items, and purchase records."""
 
-    # Start from a clean slate so repeated runs do not duplicate rows.
-    session.execute(delete(Purchase))
-    session.execute(delete(ItemSupplier))
-    session.execute(delete(CustomerAddress))
-    session.execute(delete(Customer))
-    session.execute(delete(Item))
-    session.execute(delete(Supplier))
-    session.execute(delete(Category))
-
-    categories = [
-        Category(name="Peripherals"),
-        Category(name="Monitors"),
-        Category(name="Accessories"),
-    ]
-
-    suppliers = [
-        Supplier(name="Acme Distribution", contact_email="sales@acme.com"),
-        Supplier(name="Brightline Wholesale", contact_email="hello@brightline.com"),
-    ]
-
-    customers = [
-        Customer(name="Alice Johnson", email="alice@example.com"),
-        Customer(name="Brian Lee", email="brian@example.com"),
-        Customer(name="Carla Mendes", email="carla@example.com"),
-    ]
-
-    session.add_all([*categories, *suppliers, *customers])
-    session.flush()
-
-    addresses = [
-        CustomerAddress(
-            customer_id=customers[0].id,
-            label="Home",
-            street="123 Maple Street",
-            city="Springfield",
-            state="IL",
-            postal_code="62704",
-            country="USA",
-        ),
-        CustomerAddress(
-            customer_id=customers[0].id,
-            label="Office",
-            street="1 Innovation Way",
-            city="Chicago",
-            state="IL",
-            postal_code="60601",
-            country="USA",
-        ),
-        CustomerAddress(
-            customer_id=customers[1].id,
-            label="Home",
-            street="500 Ocean Avenue",
-            city="San Francisco",
-            state="CA",
-            postal_code="94107",
-            country="USA",
-        ),
-        CustomerAddress(
-            customer_id=customers[2].id,
-            label="Home",
-            street="90 Greenway Plaza",
-            city="Austin",
-            state="TX",
-            postal_code="73301",
-            country="USA",
-        ),
-    ]
-
-    items = [
-        Item(
-            name="Wireless Mouse",
-            price=Decimal("29.99"),
-            category_id=categories[0].id,
-        ),
-        Item(
-            name="Mechanical Keyboard",
-            price=Decimal("129.50"),
-            category_id=categories[0].id,
-        ),
-        Item(
-            name="27-inch Monitor",
-            price=Decimal("249.00"),
-            category_id=categories[1].id,
-        ),
-        Item(
-            name="USB-C Hub",
-            price=Decimal("59.95"),
-            category_id=categories[2].id,
-        ),
-        Item(
-            name="Noise-Cancelling Headset",
-            price=Decimal("199.00"),
-            category_id=categories[0].id,
-        ),
-    ]
-
-    session.add_all([*addresses, *items])
-    session.flush()
-
-    item_suppliers = [
-        ItemSupplier(
-            item_id=items[0].id,
-            supplier_id=suppliers[0].id,
-            wholesale_price=Decimal("19.99"),
-            lead_time_days=5,
-        ),
-        ItemSupplier(
-            item_id=items[1].id,
-            supplier_id=suppliers[0].id,
-            wholesale_price=Decimal("95.00"),
-            lead_time_days=10,
-        ),
-        ItemSupplier(
-            item_id=items[2].id,
-            supplier_id=suppliers[1].id,
-            wholesale_price=Decimal("210.00"),
-            lead_time_days=12,
-        ),
-        ItemSupplier(
-            item_id=items[3].id,
-            supplier_id=suppliers[1].id,
-            wholesale_price=Decimal("42.50"),
-            lead_time_days=7,
-        ),
-        ItemSupplier(
-            item_id=items[4].id,
-            supplier_id=suppliers[0].id,
-            wholesale_price=Decimal("150.00"),
-            lead_time_days=9,
-        ),
-        ItemSupplier(
-            item_id=items[4].id,
-            supplier_id=suppliers[1].id,
-            wholesale_price=Decimal("155.00"),
-            lead_time_days=6,
-        ),
-    ]
-
-    session.add_all(item_suppliers)
-    session.flush()
-
-    purchases = [
-        Purchase(
-            customer_id=customers[0].id,
-            item_id=items[0].id,
-            quantity=1,
-            total_amount=items[0].price,
-            shipping_address_id=addresses[0].id,
-        ),
-        Purchase(
-            customer_id=customers[0].id,
-            item_id=items[2].id,
-            quantity=1,
-            total_amount=items[2].price,
-            shipping_address_id=addresses[1].id,
-        ),
-        Purchase(
-            customer_id=customers[1].id,
-            item_id=items[1].id,
-            quantity=2,
-            total_amount=items[1].price * 2,
-            shipping_address_id=addresses[2].id,
-        ),
-        Purchase(
-            customer_id=customers[1].id,
-            item_id=items[3].id,
-            quantity=1,
-            total_amount=items[3].price,
-            shipping_address_id=addresses[2].id,
-        ),
-        Purchase(
-            customer_id=customers[2].id,
-            item_id=items[0].id,
-            quantity=3,
-            total_amount=items[0].price * 3,
-            shipping_address_id=addresses[3].id,
-        ),
-        Purchase(
-            customer_id=customers[2].id,
-            item_id=items[4].id,
-            quantity=1,
-            total_amount=items[4].price,
-            shipping_address_id=addresses[3].id,
-        ),
-    ]
-
-    session.add_all(purchases)
-    session.commit()
+    with session.begin():
+        # Start from a clean slate so repeated runs do not duplicate rows.
+        _clear_tables(session)
+        bulk_seed(session)
+
+
+def bulk_seed(session: Session) -> None:
+    """Insert the rows from ``seed_data`` with one bulk statement per table."""
+
+    category_ids = _insert_returning_ids(session, Category, seed_data.CATEGORIES)
+    supplier_ids = _insert_returning_ids(session, Supplier, seed_data.SUPPLIERS)
+    customer_ids = _insert_returning_ids(session, Customer, seed_data.CUSTOMERS)
+
+    address_ids = _insert_returning_ids(
+        session,
+        CustomerAddress,
+        [
+            {
+                **{key: value for key, value in address.items() if key != "customer"},
+                "customer_id": customer_ids[address["customer"]],
+            }
+            for address in seed_data.ADDRESSES
+        ],
+    )
+
+    item_ids = _insert_returning_ids(
+        session,
+        Item,
+        [
+            {
+                "name": item["name"],
+                "price": _from_cents(item["price_cents"]),
+                "category_id": category_ids[item["category"]],
+            }
+            for item in seed_data.ITEMS
+        ],
+    )
+
+    _insert_rows(
+        session,
+        ItemSupplier,
+        [
+            {
+                "item_id": item_ids[link["item"]],
+                "supplier_id": supplier_ids[link["supplier"]],
+                "wholesale_price": _from_cents(link["wholesale_price_cents"]),
+                "lead_time_days": link["lead_time_days"],
+            }
+            for link in seed_data.ITEM_SUPPLIERS
+        ],
+    )
+
+    # Purchase totals are plain int arithmetic on cents; Decimal only at the boundary.
+    # COPY bypasses ORM-side defaults, so the purchase timestamp is set explicitly.
+    purchased_at = datetime.now(timezone.utc)
+    _insert_rows(
+        session,
+        Purchase,
+        [
+            {
+                "customer_id": customer_ids[purchase["customer"]],
+                "item_id": item_ids[purchase["item"]],
+                "quantity": purchase["quantity"],
+                "total_amount": _from_cents(
+                    seed_data.ITEMS[purchase["item"]]["price_cents"] * purchase["quantity"]
+                ),
+                "shipping_address_id": address_ids[purchase["address"]],
+                "purchased_at": purchased_at,
+            }
+            for purchase in seed_data.PURCHASES
+        ],
+    )
 
 
 def main() -> None:
     engine: Session.bind.__class__ | None = None  # type: ignore[attr-defined]
     try:
-        engine = create_postgres_engine()
+        engine = get_engine()
+        _relax_sqlite_durability(engine)
         # Rebuild the schema so older databases pick up new columns like Item.category_id.
         Base.metadata.drop_all(engine)
         Base.metadata.create_all(engine)
@@ -3,15 +3,44 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import os
+import sqlite3
+from array import array
+from contextlib import closing
+from pathlib import Path
+from typing import Sequence
 
 import weaviate
+from weaviate.classes.data import DataObject
 from weaviate.exceptions import WeaviateBaseError
 
-from nodepragagent.embeddings import embed_contents
+from nodepragagent.embeddings import _embedding_model, close_embedding_clients, embed_contents
 from nodepragagent.tools import _weaviate_client
-from nodepragagent.vllm import VLLMConfig
 
 CLASS_NAME = "ProductInsight"
+INGEST_CHUNK_SIZE = 32
+# Vector compression for the HNSW index: "sq" (int8 scalar), "bq" (binary), "pq" or "none".
+# SQ and PQ train on the first ``trainingLimit`` vectors and stay uncompressed until then.
+VECTOR_QUANTIZER = os.getenv("WEAVIATE_QUANTIZER", "sq").strip().lower()
+QUANTIZER_RESCORE_LIMIT = 20
+EMBEDDING_CACHE_PATH = Path(
+    os.getenv("EMBEDDING_CACHE_PATH", Path.home() / ".cache" / "nodepragagent" / "embeds.sqlite")
+)
+
+
+def _vector_index_config() -> dict[str, object]:
+    """Return the HNSW index settings for the configured quantizer."""
+
+    if VECTOR_QUANTIZER == "none":
+        return {}
+    if VECTOR_QUANTIZER == "sq":
+        quantizer: dict[str, object] = {"enabled": True, "rescoreLimit": QUANTIZER_RESCORE_LIMIT}
+    elif VECTOR_QUANTIZER in ("bq", "pq"):
+        quantizer = {"enabled": True}
+    else:
+        raise ValueError(f"Unsupported WEAVIATE_QUANTIZER: {VECTOR_QUANTIZER!r}")
+    return {VECTOR_QUANTIZER: quantizer}
 
 
 async def _reset_schema(client: weaviate.WeaviateAsyncClient) -> None:
@@ -23,6 +52,9 @@ async def _reset_schema(client: weaviate.WeaviateAsyncClient) -> None:
             "class": CLASS_NAME,
             "description": "Product catalogue facts and company economic notes",
             "vectorizer": "none",
+            # Quantized vectors cut index memory and distance cost; queries are unchanged.
+            "vectorIndexType": "hnsw",
+            "vectorIndexConfig": _vector_index_config(),
             "properties": [
                 {"name": "title", "dataType": ["text"], "description": "Document title"},
                 {
@@ -40,193 +72,286 @@ async def _reset_schema(client: weaviate.WeaviateAsyncClient) -> None:
     )
 
 
-def _documents() -> list[dict[str, str]]:
-    return [
-        {
-            "title": "Wireless Mouse Overview",
-            "category": "item",
-            "content": (
-                "Wireless Mouse retail details: silent-scroll design, bundled USB receiver, "
-                "inventory of 120 units. List price USD 29.99, margin target 35 percent, "
-                "and break-even volume currently projected at 82 units per month. Packaging refresh "
-                "scheduled for Q3 to highlight recyclable materials and reduced plastic footprint."
-            ),
-        },
-        {
-            "title": "Mechanical Keyboard Sales",
-            "category": "item",
-            "content": (
-                "Mechanical Keyboard with hot-swappable switches and RGB backlight. "
-                "Premium accessory positioned at USD 129.50, typical basket attachment "
-                "rate 18 percent in B2B accounts. Channel partners report a 12 percent upsell "
-                "lift when bundled with ergonomic wrist rests, and supply chain indicates a "
-                "two-week lead time for Kailh switch replenishment."
-            ),
-        },
-        {
-            "title": "27-inch Monitor Performance",
-            "category": "item",
-            "content": (
-                "27-inch Monitor, 1440p IPS panel, warranty three years. Price point USD 249.00 "
-                "supports bundles with docking stations, accessory sell-through 1.4 add-ons per sale. "
-                "Customer feedback praises color calibration presets and notes desire for USB-C "
-                "power delivery in future revisions. Returns sit below 1.8 percent thanks to on-site setup videos."
-            ),
-        },
-        {
-            "title": "USB-C Hub Attachment",
-            "category": "item",
-            "content": (
-                "USB-C Hub with eight ports, shipping with braided cable. MSRP USD 59.95, discountable "
-                "in education verticals with minimum margin 22 percent. Firmware includes automated load balancing "
-                "to prevent brownouts on high-draw ports, and packaging inserts promote companion warranty subscriptions."
-            ),
-        },
-        {
-            "title": "Quarterly Financial Snapshot",
-            "category": "company",
-            "content": (
-                "Company posted Q2 revenue of USD 4.2M with gross margin 41 percent. Operating expenses "
-                "trended flat quarter-over-quarter as marketing shifted toward digital campaigns. Cash "
-                "reserves cover 14 months of runway even with continued R&D investment. Board directives emphasize "
-                "maintaining positive net retention above 118 percent while allocating 12 percent of revenue to innovation labs."
-            ),
-        },
-        {
-            "title": "Remote Work Policy Highlights",
-            "category": "policy",
-            "content": (
-                "Remote-first staffing policy mandates core hours 10:00-15:00 GMT, ergonomic stipend USD 450 "
-                "per teammate annually, and quarterly home office audits to ensure compliance with safety standards. "
-                "Teams coordinate through asynchronous standups, and managers receive training on inclusive facilitation "
-                "to reduce meeting overload and time zone friction."
-            ),
-        },
-        {
-            "title": "Sustainability Roadmap 2025",
-            "category": "policy",
-            "content": (
-                "Blue Horizon Tech targets carbon-neutral operations by FY2025 through renewable energy contracts, "
-                "vendor audits, and mandatory eco-design reviews for new hardware. KPIs include 30 percent waste "
-                "reduction and ISO 14001 certification. Sustainability dashboard publishes quarterly updates, "
-                "and procurement must prioritize suppliers with verified low-emission logistics."
-            ),
-        },
-        {
-            "title": "Customer Success Playbook",
-            "category": "practice",
-            "content": (
-                "Three-tier account framework with proactive health scoring, executive business reviews on a 90-day "
-                "cadence, and escalation matrix linking product, support, and finance for high-risk renewals. Playbook "
-                "recommends quarterly voice-of-customer synthesis and mandates closing the loop on top-five feature requests."
-            ),
-        },
-        {
-            "title": "AI Enablement Program",
-            "category": "practice",
-            "content": (
-                "Internal enablement tracks upskill teams on prompt design, ethical guardrails, and model observability. "
-                "Pilot projects receive 8-week sandbox access and must publish impact retrospectives before scaling. "
-                "Curriculum includes shadow reviews with the Ethical AI Council and a shared repository of reusable prompt patterns."
-            ),
-        },
-        {
-            "title": "Blue Horizon Business Plan 2024-2027",
-            "category": "strategy",
-            "content": (
-                "Three-year growth plan prioritizes mid-market expansion, embedded analytics, and recurring revenue at 78 percent. "
-                "Assumes Series C raise in Q1 2025 to fuel acquisitions of boutique AI workflow startups. Year-by-year milestones "
-                "outline geographic expansion into DACH and APAC regions, coupled with product-led growth experiments."
-            ),
-        },
-        {
-            "title": "Data Governance Standards",
-            "category": "policy",
-            "content": (
-                "Company maintains tiered data classification, quarterly SOC 2 type II audits, and zero-trust access with "
-                "mandatory hardware keys. Product telemetry anonymized within 15 minutes under privacy-by-design charter. "
-                "Incident response runbooks stored in a signed vault, and data stewards convene monthly to review anomalies."
-            ),
-        },
-        {
-            "title": "Sales Enablement Quarterly Goals",
-            "category": "strategy",
-            "content": (
-                "Revenue operations to deliver 12 modular playbooks, refresh ROI calculators, and cut onboarding ramp by 25 percent. "
-                "Regional pods trial blended coaching combining async libraries with live deal reviews. Additional KPIs track demo-to-close "
-                "conversion improvements and require weekly insights sharing between product marketing and frontline sellers."
-            ),
-        },
-        {
-            "title": "People Operations Inclusion Guidelines",
-            "category": "policy",
-            "content": (
-                "Hiring managers apply requirement libraries to eliminate biased language, conduct structured interviews, and "
-                "publish promotion dossiers for transparency. Inclusion council owns quarterly sentiment pulse checks and "
-                "sponsors mentorship pairings focused on cross-functional skill growth."
-            ),
-        },
-        {
-            "title": "Product Lifecycle Review",
-            "category": "practice",
-            "content": (
-                "Every feature exits discovery only after dual-track validation, quantified user value scoring, and a live "
-                "operability drill. End-of-life protocol includes 9-month notice and migration kits. Change advisory board reviews "
-                "implementation risk, and learnings feed back into the opportunity backlog."
-            ),
-        },
-        {
-            "title": "Cyber Resilience Incident Drill",
-            "category": "practice",
-            "content": (
-                "Semi-annual red team exercise covering credential stuffing, supply-chain injection, and backup restores. "
-                "Post-mortems log mean-time-to-detect and board-level action items. Exercises conclude with tabletop simulations "
-                "for executive stakeholders to refine communications protocols."
-            ),
-        },
-        {
-            "title": "Partner Ecosystem Charter",
-            "category": "strategy",
-            "content": (
-                "Channel alliances segmented by solution depth with tiered MDF programs. Certifications demand co-marketing assets, "
-                "shared telemetry, and renewal influence targets for strategic partners. Charter introduces quarterly partner councils "
-                "to co-design roadmaps and align incentive structures."
-            ),
-        },
-        {
-            "title": "Ethical AI Council Mandate",
-            "category": "policy",
-            "content": (
-                "Council meets monthly to review bias testing, user consent flows, and regulatory updates. Decisions require quorum of legal, "
-                "data science, and customer advocacy leads with published minutes. Charter mandates scenario planning for upcoming legislation "
-                "and tracks remediation commitments through an open dashboard."
-            ),
-        },
-    ]
+# Built once at import; callers must treat the documents as read-only.
+_DOCUMENTS: tuple[dict[str, str], ...] = (
+    {
+        "title": "Wireless Mouse Overview",
+        "category": "item",
+        "content": (
+            "Wireless Mouse retail details: silent-scroll design, bundled USB receiver, "
+            "inventory of 120 units. List price USD 29.99, margin target 35 percent, "
+            "and break-even volume currently projected at 82 units per month. Packaging refresh "
+            "scheduled for Q3 to highlight recyclable materials and reduced plastic footprint."
+        ),
+    },
+    {
+        "title": "Mechanical Keyboard Sales",
+        "category": "item",
+        "content": (
+            "Mechanical Keyboard with hot-swappable switches and RGB backlight. "
+            "Premium accessory positioned at USD 129.50, typical basket attachment "
+            "rate 18 percent in B2B accounts. Channel partners report a 12 percent upsell "
+            "lift when bundled with ergonomic wrist rests, and supply chain indicates a "
+            "two-week lead time for Kailh switch replenishment."
+        ),
+    },
+    {
+        "title": "27-inch Monitor Performance",
+        "category": "item",
+        "content": (
+            "27-inch Monitor, 1440p IPS panel, warranty three years. Price point USD 249.00 "
+            "supports bundles with docking stations, accessory sell-through 1.4 add-ons per sale. "
+            "Customer feedback praises color calibration presets and notes desire for USB-C "
+            "power delivery in future revisions. Returns sit below 1.8 percent thanks to on-site setup videos."
+        ),
+    },
+    {
+        "title": "USB-C Hub Attachment",
+        "category": "item",
+        "content": (
+            "USB-C Hub with eight ports, shipping with braided cable. MSRP USD 59.95, discountable "
+            "in education verticals with minimum margin 22 percent. Firmware includes automated load balancing "
+            "to prevent brownouts on high-draw ports, and packaging inserts promote companion warranty subscriptions."
+        ),
+    },
+    {
+        "title": "Quarterly Financial Snapshot",
+        "category": "company",
+        "content": (
+            "Company posted Q2 revenue of USD 4.2M with gross margin 41 percent. Operating expenses "
+            "trended flat quarter-over-quarter as marketing shifted toward digital campaigns. Cash "
+            "reserves cover 14 months of runway even with continued R&D investment. Board directives emphasize "
+            "maintaining positive net retention above 118 percent while allocating 12 percent of revenue to innovation labs."
+        ),
+    },
+    {
+        "title": "Remote Work Policy Highlights",
+        "category": "policy",
+        "content": (
+            "Remote-first staffing policy mandates core hours 10:00-15:00 GMT, ergonomic stipend USD 450 "
+            "per teammate annually, and quarterly home office audits to ensure compliance with safety standards. "
+            "Teams coordinate through asynchronous standups, and managers receive training on inclusive facilitation "
+            "to reduce meeting overload and time zone friction."
+        ),
+    },
+    {
+        "title": "Sustainability Roadmap 2025",
+        "category": "policy",
+        "content": (
+            "Blue Horizon Tech targets carbon-neutral operations by FY2025 through renewable energy contracts, "
+            "vendor audits, and mandatory eco-design reviews for new hardware. KPIs include 30 percent waste "
+            "reduction and ISO 14001 certification. Sustainability dashboard publishes quarterly updates, "
+            "and procurement must prioritize suppliers with verified low-emission logistics."
+        ),
+    },
+    {
+        "title": "Customer Success Playbook",
+        "category": "practice",
+        "content": (
+            "Three-tier account framework with proactive health scoring, executive business reviews on a 90-day "
+            "cadence, and escalation matrix linking product, support, and finance for high-risk renewals. Playbook "
+            "recommends quarterly voice-of-customer synthesis and mandates closing the loop on top-five feature requests."
+        ),
+    },
+    {
+        "title": "AI Enablement Program",
+        "category": "practice",
+        "content": (
+            "Internal enablement tracks upskill teams on prompt design, ethical guardrails, and model observability. "
+            "Pilot projects receive 8-week sandbox access and must publish impact retrospectives before scaling. "
+            "Curriculum includes shadow reviews with the Ethical AI Council and a shared repository of reusable prompt patterns."
+        ),
+    },
+    {
+        "title": "Blue Horizon Business Plan 2024-2027",
+        "category": "strategy",
+        "content": (
+            "Three-year growth plan prioritizes mid-market expansion, embedded analytics, and recurring revenue at 78 percent. "
+            "Assumes Series C raise in Q1 2025 to fuel acquisitions of boutique AI workflow startups. Year-by-year milestones "
+            "outline geographic expansion into DACH and APAC regions, coupled with product-led growth experiments."
+        ),
+    },
+    {
+        "title": "Data Governance Standards",
+        "category": "policy",
+        "content": (
+            "Company maintains tiered data classification, quarterly SOC 2 type II audits, and zero-trust access with "
+            "mandatory hardware keys. Product telemetry anonymized within 15 minutes under privacy-by-design charter. "
+            "Incident response runbooks stored in a signed vault, and data stewards convene monthly to review anomalies."
+        ),
+    },
+    {
+        "title": "Sales Enablement Quarterly Goals",
+        "category": "strategy",
+        "content": (
+            "Revenue operations to deliver 12 modular playbooks, refresh ROI calculators, and cut onboarding ramp by 25 percent. "
+            "Regional pods trial blended coaching combining async libraries with live deal reviews. Additional KPIs track demo-to-close "
+            "conversion improvements and require weekly insights sharing between product marketing and frontline sellers."
+        ),
+    },
+    {
+        "title": "People Operations Inclusion Guidelines",
+        "category": "policy",
+        "content": (
+            "Hiring managers apply requirement libraries to eliminate biased language, conduct structured interviews, and "
+            "publish promotion dossiers for transparency. Inclusion council owns quarterly sentiment pulse checks and "
+            "sponsors mentorship pairings focused on cross-functional skill growth."
+        ),
+    },
+    {
+        "title": "Product Lifecycle Review",
+        "category": "practice",
+        "content": (
+            "Every feature exits discovery only after dual-track validation, quantified user value scoring, and a live "
+            "operability drill. End-of-life protocol includes 9-month notice and migration kits. Change advisory board reviews "
+            "implementation risk, and learnings feed back into the opportunity backlog."
+        ),
+    },
+    {
+        "title": "Cyber Resilience Incident Drill",
+        "category": "practice",
+        "content": (
+            "Semi-annual red team exercise covering credential stuffing, supply-chain injection, and backup restores. "
+            "Post-mortems log mean-time-to-detect and board-level action items. Exercises conclude with tabletop simulations "
+            "for executive stakeholders to refine communications protocols."
+        ),
+    },
+    {
+        "title": "Partner Ecosystem Charter",
+        "category": "strategy",
+        "content": (
+            "Channel alliances segmented by solution depth with tiered MDF programs. Certifications demand co-marketing assets, "
+            "shared telemetry, and renewal influence targets for strategic partners. Charter introduces quarterly partner councils "
+            "to co-design roadmaps and align incentive structures."
+        ),
+    },
+    {
+        "title": "Ethical AI Council Mandate",
+        "category": "policy",
+        "content": (
+            "Council meets monthly to review bias testing, user consent flows, and regulatory updates. Decisions require quorum of legal, "
+            "data science, and customer advocacy leads with published minutes. Charter mandates scenario planning for upcoming legislation "
+            "and tracks remediation commitments through an open dashboard."
+        ),
+    },
+)
 
 
-async def _load_documents(client: weaviate.WeaviateAsyncClient) -> None:
-    docs = _documents()
-    try:
-        vectors = await embed_contents((doc["content"] for doc in docs), config=VLLMConfig())
-    except Exception as exc:  # pragma: no cover - embedding request failure
-        raise SystemExit(f"Failed to compute embeddings: {exc}")
+def _documents() -> tuple[dict[str, str], ...]:
+    return _DOCUMENTS
+
+
+def _cache_key(content: str, model: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(content.encode("utf-8"))
+    return digest.hexdigest()
 
+
+def _open_cache() -> sqlite3.Connection:
+    EMBEDDING_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(EMBEDDING_CACHE_PATH)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+    )
+    return connection
+
+
+def _read_cached_vectors(cache: sqlite3.Connection, keys: list[str]) -> dict[str, list[float]]:
+    placeholders = ", ".join("?" for _ in keys)
+    rows = cache.execute(
+        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", keys
+    )
+    vectors: dict[str, list[float]] = {}
+    for key, raw in rows:
+        vector = array("f")
+        vector.frombytes(raw)
+        vectors[key] = vector.tolist()
+    return vectors
+
+
+async def _embed_documents(docs: Sequence[dict[str, str]]) -> list[list[float]]:
+    """Embed document contents, reusing vectors cached on disk from previous runs."""
+
+    model = _embedding_model()
+    keys = [_cache_key(doc["content"], model) for doc in docs]
+
+    with closing(_open_cache()) as cache:
+        vectors = _read_cached_vectors(cache, keys)
+        missing = [idx for idx, key in enumerate(keys) if key not in vectors]
+
+        if missing:
+            try:
+                fresh = await embed_contents(
+                    [docs[idx]["content"] for idx in missing], model=model
+                )
+            except Exception as exc:  # pragma: no cover - embedding request failure
+                raise SystemExit(f"Failed to compute embeddings: {exc}")
+            if len(fresh) != len(missing):
+                raise SystemExit("Failed to compute embeddings: embedding endpoint returned no data")
+
+            for idx, vector in zip(missing, fresh, strict=True):
+                vectors[keys[idx]] = list(vector)
+            with cache:
+                cache.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(keys[idx], array("f", vectors[keys[idx]]).tobytes()) for idx in missing],
+                )
+
+    return [vectors[key] for key in keys]
+
+
+async def _load_documents(
+    client: weaviate.WeaviateAsyncClient,
+    docs: Sequence[dict[str, str]],
+    vectors: list[list[float]],
+) -> None:
     collection = client.collections.get(CLASS_NAME)
-    for doc, vector in zip(docs, vectors, strict=True):
-        await collection.data.insert(doc, vector=vector)
+    objects = [
+        DataObject(properties=doc, vector=vector)
+        for doc, vector in zip(docs, vectors, strict=True)
+    ]
+    result = await collection.data.insert_many(objects)
+    if result.has_errors:
+        messages = sorted({error.message for error in result.errors.values()})
+        raise SystemExit(f"Failed to insert documents: {'; '.join(messages)}")
+
+
+async def _ingest(client: weaviate.WeaviateAsyncClient, docs: Sequence[dict[str, str]]) -> None:
+    """Embed and insert documents chunk by chunk so embedding and inserts overlap."""
+
+    queue: asyncio.Queue[tuple[Sequence[dict[str, str]], list[list[float]]] | None] = (
+        asyncio.Queue(maxsize=2)
+    )
+
+    async def produce() -> None:
+        try:
+            for start in range(0, len(docs), INGEST_CHUNK_SIZE):
+                chunk = docs[start : start + INGEST_CHUNK_SIZE]
+                await queue.put((chunk, await _embed_documents(chunk)))
+        finally:
+            await queue.put(None)
+
+    async def consume() -> None:
+        # The schema reset runs while the first chunk is still being embedded.
+        await _reset_schema(client)
+        while (item := await queue.get()) is not None:
+            chunk, vectors = item
+            await _load_documents(client, chunk, vectors)
+
+    await asyncio.gather(produce(), consume())
 
 
 async def _main_async() -> None:
     client = _weaviate_client()
     try:
         await client.connect()
-        await _reset_schema(client)
-        await _load_documents(client)
+        await _ingest(client, _documents())
     except WeaviateBaseError as exc:
         raise SystemExit(f"Failed to load documents: {exc}")
     finally:
-        await client.close()
+        await asyncio.gather(client.close(), close_embedding_clients())
     print("Dummy documents loaded into Weaviate.")
 
 
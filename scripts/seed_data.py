@@ -0,0 +1,90 @@
+"""Deterministic dummy rows used to seed the transactional database.
+
+Foreign keys are expressed as indexes into the parent lists so the data can be
+inserted in bulk and resolved against the primary keys returned by the database.
+Monetary amounts are stored as integer cents.
+"""
+
+from __future__ import annotations
+
+CATEGORIES: list[dict[str, str]] = [
+    {"name": "Peripherals"},
+    {"name": "Monitors"},
+    {"name": "Accessories"},
+]
+
+SUPPLIERS: list[dict[str, str]] = [
+    {"name": "Acme Distribution", "contact_email": "sales@acme.com"},
+    {"name": "Brightline Wholesale", "contact_email": "hello@brightline.com"},
+]
+
+CUSTOMERS: list[dict[str, str]] = [
+    {"name": "Alice Johnson", "email": "alice@example.com"},
+    {"name": "Brian Lee", "email": "brian@example.com"},
+    {"name": "Carla Mendes", "email": "carla@example.com"},
+]
+
+ADDRESSES: list[dict[str, str | int]] = [
+    {
+        "customer": 0,
+        "label": "Home",
+        "street": "123 Maple Street",
+        "city": "Springfield",
+        "state": "IL",
+        "postal_code": "62704",
+        "country": "USA",
+    },
+    {
+        "customer": 0,
+        "label": "Office",
+        "street": "1 Innovation Way",
+        "city": "Chicago",
+        "state": "IL",
+        "postal_code": "60601",
+        "country": "USA",
+    },
+    {
+        "customer": 1,
+        "label": "Home",
+        "street": "500 Ocean Avenue",
+        "city": "San Francisco",
+        "state": "CA",
+        "postal_code": "94107",
+        "country": "USA",
+    },
+    {
+        "customer": 2,
+        "label": "Home",
+        "street": "90 Greenway Plaza",
+        "city": "Austin",
+        "state": "TX",
+        "postal_code": "73301",
+        "country": "USA",
+    },
+]
+
+ITEMS: list[dict[str, str | int]] = [
+    {"name": "Wireless Mouse", "price_cents": 2999, "category": 0},
+    {"name": "Mechanical Keyboard", "price_cents": 12950, "category": 0},
+    {"name": "27-inch Monitor", "price_cents": 24900, "category": 1},
+    {"name": "USB-C Hub", "price_cents": 5995, "category": 2},
+    {"name": "Noise-Cancelling Headset", "price_cents": 19900, "category": 0},
+]
+
+ITEM_SUPPLIERS: list[dict[str, int]] = [
+    {"item": 0, "supplier": 0, "wholesale_price_cents": 1999, "lead_time_days": 5},
+    {"item": 1, "supplier": 0, "wholesale_price_cents": 9500, "lead_time_days": 10},
+    {"item": 2, "supplier": 1, "wholesale_price_cents": 21000, "lead_time_days": 12},
+    {"item": 3, "supplier": 1, "wholesale_price_cents": 4250, "lead_time_days": 7},
+    {"item": 4, "supplier": 0, "wholesale_price_cents": 15000, "lead_time_days": 9},
+    {"item": 4, "supplier": 1, "wholesale_price_cents": 15500, "lead_time_days": 6},
+]
+
+PURCHASES: list[dict[str, int]] = [
+    {"customer": 0, "item": 0, "quantity": 1, "address": 0},
+    {"customer": 0, "item": 2, "quantity": 1, "address": 1},
+    {"customer": 1, "item": 1, "quantity": 2, "address": 2},
+    {"customer": 1, "item": 3, "quantity": 1, "address": 2},
+    {"customer": 2, "item": 0, "quantity": 3, "address": 3},
+    {"customer": 2, "item": 4, "quantity": 1, "address": 3},
+]
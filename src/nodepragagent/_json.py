@@ -0,0 +1,72 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize ``obj`` to UTF-8 encoded JSON.
+
+    Output is compact unless ``indent`` is set, in which case it uses two spaces.
+    """
+
+    if orjson is not None:
+        # Dataclasses go to ``default`` as they do with the stdlib encoder. Some output
+        # still differs between the two: orjson writes datetimes in ISO format itself and
+        # NaN/Infinity as null.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # orjson rejects some input the stdlib accepts, such as integers beyond 64
+            # bits; retry there before giving up.
+            pass
+
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        default=default,
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """Serialize ``obj`` to a JSON string."""
+
+    return dumps_bytes(obj, indent=indent, sort_keys=sort_keys, default=default).decode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document; raises ``json.JSONDecodeError`` on invalid input."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dumps", "dumps_bytes", "loads"]
@@ -2,18 +2,28 @@
 
 import asyncio
 import argparse
+import functools
 import sys
-from typing import Sequence
-import json
+from typing import AsyncIterator, Sequence
 from openai import OpenAIError
 
-from .tools import OPENAI_CHAT_TOOLS, POSTGRES_SCHEMA
-from .vllm import SearchAgent, VLLMConfig, DeepSeekConfig
-from .utils import cli_event_printer
+from . import _json
+from .tools import OPENAI_CHAT_TOOLS, POSTGRES_SCHEMA, close_weaviate_client
+from .config import default_vllm_config
+from .embeddings import close_embedding_clients
+from .db import dispose_async_engines
+from .vllm import SearchAgent, DeepSeekConfig
+from .utils import cli_event_printer, read_stdin
 from dotenv import load_dotenv
+
+try:
+    import uvloop  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - uvloop is an optional speedup
+    uvloop = None
+
 load_dotenv()
 
-POSTGRES_SCHEMA_JSON = json.dumps(POSTGRES_SCHEMA, indent=0)
+POSTGRES_SCHEMA_JSON = _json.dumps(POSTGRES_SCHEMA)
 
 SYSTEM_PROMPT = (
     "You are a Hybrid Search Agent that must respond truthfully to the user's questions.\n"
@@ -28,53 +38,46 @@ SYSTEM_PROMPT = (
     "When you have the final answer, respond in a well written manner, citing the sources you used to construct your answer. Do not answer in json format.\n"
 )
 
-async def main(argv: Sequence[str] | None = None) -> None:
-    """Run the RAG agent CLI loop."""
+BATCH_CONCURRENCY = 8
 
-    parser = argparse.ArgumentParser(description="Interact with the NoDep RAG agent from the CLI")
-    parser.add_argument(
-        "prompt",
-        nargs="*",
-        help="Optional single turn prompt to run without starting the interactive loop",
-    )
-    parser.add_argument(
-        "--save-history",
-        dest="save_history",
-        metavar="PATH",
-        help="File path where the full conversation history will be stored as JSON",
-    )
 
-    if argv is None:
-        argv = sys.argv[1:]
+async def _prompt_lines() -> AsyncIterator[str]:
+    """Yield prompts typed by the user until they exit or close the input stream."""
 
-    args = parser.parse_args(argv)
-    prompt_arg = " ".join(args.prompt).strip() if args.prompt else None
+    if not sys.stdin.isatty():
+        async for prompt in _piped_lines():
+            yield prompt
+        return
 
-    default_config = VLLMConfig()
-    client = SearchAgent(
-        config=default_config,
-        reporter=cli_event_printer,
-        tools=OPENAI_CHAT_TOOLS,
-        system_prompt=SYSTEM_PROMPT,
-    )
-
-    if prompt_arg:
-        prompt = prompt_arg
-    else:
+    while True:
         try:
-            prompt = input("You> ").strip()
+            # Read on a worker thread so the event loop is not blocked while waiting.
+            prompt = (await read_stdin(functools.partial(input, "You> "))).strip()
         except EOFError:
             print()
             return
-        except KeyboardInterrupt:
-            print()
+
+        if prompt.lower() in {"exit", "quit"}:
             return
+        if prompt:
+            yield prompt
+
 
-        if not prompt or prompt.lower() in {"exit", "quit"}:
+async def _piped_lines() -> AsyncIterator[str]:
+    """Yield prompts from non-interactive stdin using its buffered reader."""
+
+    # input() writes and flushes a prompt per line; a plain readline avoids that.
+    while line := await read_stdin(sys.stdin.readline):
+        prompt = line.strip()
+        if prompt.lower() in {"exit", "quit"}:
             return
+        if prompt:
+            yield prompt
+
 
+async def _run_prompt(client: SearchAgent, prompt: str) -> None:
     try:
-        response = await client.generate_from_messages(
+        await client.generate_from_messages(
             prompt,
             temperature=1,
             max_tokens=2048,
@@ -82,12 +85,130 @@ async def main(argv: Sequence[str] | None = None) -> None:
     except OpenAIError as exc:
         print(f"[ERROR] Failed to call model: {exc}", file=sys.stderr)
 
-    if args.save_history:
+
+async def _answer_independently(
+    prompt: str, semaphore: asyncio.Semaphore
+) -> str | OpenAIError:
+    async with semaphore:
+        # Each prompt gets its own agent so conversations never share history.
+        client = SearchAgent(
+            config=default_vllm_config(),
+            tools=OPENAI_CHAT_TOOLS,
+            system_prompt=SYSTEM_PROMPT,
+        )
         try:
-            client.save_history(args.save_history)
+            return await client.generate_from_messages(
+                prompt,
+                temperature=1,
+                max_tokens=2048,
+            )
+        except OpenAIError as exc:
+            return exc
+        finally:
+            await client.aclose()
+
+
+async def _run_batch(prompts: Sequence[str], concurrency: int) -> None:
+    """Answer independent prompts concurrently and print the answers in input order."""
+
+    # Keeping several requests in flight lets vLLM batch them server-side.
+    semaphore = asyncio.Semaphore(concurrency)
+    answers = await asyncio.gather(
+        *(_answer_independently(prompt, semaphore) for prompt in prompts)
+    )
+    for index, (prompt, answer) in enumerate(zip(prompts, answers, strict=True), start=1):
+        print(f"[{index}] You> {prompt}")
+        if isinstance(answer, OpenAIError):
+            print(f"[ERROR] Failed to call model: {answer}", file=sys.stderr)
+        else:
+            print(f"[{index}] Model> {answer}")
+
+
+async def _run_conversation(prompt_arg: str | None, save_history: str | None) -> None:
+    client = SearchAgent(
+        config=default_vllm_config(),
+        reporter=cli_event_printer,
+        tools=OPENAI_CHAT_TOOLS,
+        system_prompt=SYSTEM_PROMPT,
+    )
+
+    try:
+        if prompt_arg:
+            await _run_prompt(client, prompt_arg)
+        else:
+            async for prompt in _prompt_lines():
+                await _run_prompt(client, prompt)
+    finally:
+        await client.aclose()
+
+    if save_history:
+        try:
+            await asyncio.to_thread(client.save_history, save_history)
         except OSError as exc:
             print(f"[ERROR] Failed to save history: {exc}", file=sys.stderr)
 
 
+async def main(argv: Sequence[str] | None = None) -> None:
+    """Run the RAG agent CLI loop."""
+
+    parser = argparse.ArgumentParser(description="Interact with the NoDep RAG agent from the CLI")
+    parser.add_argument(
+        "prompt",
+        nargs="*",
+        help="Optional single turn prompt to run without starting the interactive loop",
+    )
+    parser.add_argument(
+        "--save-history",
+        dest="save_history",
+        metavar="PATH",
+        help="File path where the full conversation history will be stored as JSON",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Treat each positional argument, or each piped stdin line, as an independent "
+            "prompt and answer them concurrently"
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BATCH_CONCURRENCY,
+        help="Maximum number of batch prompts in flight at once (default: %(default)s)",
+    )
+
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = parser.parse_args(argv)
+    if args.batch and args.save_history:
+        parser.error("--save-history cannot be combined with --batch")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    try:
+        if args.batch:
+            prompts = [prompt.strip() for prompt in args.prompt if prompt.strip()]
+            if not prompts:
+                prompts = [prompt async for prompt in _prompt_lines()]
+            await _run_batch(prompts, args.concurrency)
+        else:
+            prompt_arg = " ".join(args.prompt).strip() if args.prompt else None
+            await _run_conversation(prompt_arg, args.save_history)
+    finally:
+        await asyncio.gather(
+            close_embedding_clients(), close_weaviate_client(), dispose_async_engines()
+        )
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        # uvloop's faster event loop helps the many concurrent HTTP/gRPC/Postgres calls.
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
+    except KeyboardInterrupt:
+        # Ctrl-C cancels main(), whose cleanup has already run by the time we get here.
+        print()
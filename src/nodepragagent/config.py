@@ -1,33 +1,44 @@
+import functools
 import os
+from dataclasses import dataclass, field, fields
 from typing import ClassVar, Any
 
-from pydantic import BaseModel, Field, field_validator
-
 
 
 def _env_field(env_var: str, default: str) -> Any:
-    return Field(default_factory=lambda: os.getenv(env_var, default))
+    # Read at construction, not import: the CLI calls load_dotenv() after importing this
+    # module. default_vllm_config() keeps the lookups to once per process.
+    return field(default_factory=functools.partial(os.getenv, env_var, default))
 
-class ServiceConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ServiceConfig:
     """Base configuration for OpenAI-compatible services."""
 
     require_api_key: ClassVar[bool] = False
+    supports_parallel_tool_calls: ClassVar[bool] = False
     api_key_env_var: ClassVar[str] = "API_KEY"
 
     base_url: str
     api_key: str
     model: str
 
-    @field_validator("api_key")
-    @classmethod
-    def _validate_api_key(cls, value: str) -> str:
-        if cls.require_api_key and not value:
-            raise ValueError(f"{cls.api_key_env_var} environment variable must be set.")
-        return value
+    def __post_init__(self) -> None:
+        # Stands in for the type checks pydantic used to do; values usually come from env.
+        for config_field in fields(self):
+            value = getattr(self, config_field.name)
+            if not isinstance(value, str):
+                raise TypeError(
+                    f"{type(self).__name__}.{config_field.name} must be a string, "
+                    f"got {type(value).__name__}."
+                )
+        if self.require_api_key and not self.api_key:
+            raise ValueError(f"{self.api_key_env_var} environment variable must be set.")
 
+@dataclass(frozen=True, slots=True)
 class VLLMConfig(ServiceConfig):
     """Configuration for connecting to a local vLLM server."""
 
+    supports_parallel_tool_calls: ClassVar[bool] = True
     api_key_env_var: ClassVar[str] = "VLLM_API_KEY"
 
     base_url: str = _env_field("VLLM_BASE_URL", "http://localhost:11434/v1")
@@ -35,6 +46,7 @@ class VLLMConfig(ServiceConfig):
     model: str = _env_field("VLLM_MODEL", "gpt-oss:20b")
 
 
+@dataclass(frozen=True, slots=True)
 class DeepSeekConfig(ServiceConfig):
     """Configuration for the DeepSeek API endpoint loaded from environment variables."""
 
@@ -44,3 +56,10 @@ class DeepSeekConfig(ServiceConfig):
     base_url: str = _env_field("DEEPSEEK_BASE_URL", "https://api.deepseek.com")
     api_key: str = _env_field("DEEPSEEK_API_KEY", "")
     model: str = _env_field("DEEPSEEK_MODEL", "deepseek-chat")
+
+
+@functools.lru_cache(maxsize=None)
+def default_vllm_config() -> VLLMConfig:
+    """Return the environment-derived vLLM config, built once per process."""
+
+    return VLLMConfig()
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -40,10 +39,11 @@ class Item(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(120), nullable=False, unique=True)
-    price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    price: Mapped[float] = mapped_column(Numeric(10, 2, asdecimal=False), nullable=False)
     category_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("categories.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
 
     purchases: Mapped[List["Purchase"]] = relationship(
@@ -103,12 +103,16 @@ class ItemSupplier(Base):
     item_id: Mapped[int] = mapped_column(
         ForeignKey("items.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     supplier_id: Mapped[int] = mapped_column(
         ForeignKey("suppliers.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
+    )
+    wholesale_price: Mapped[float] = mapped_column(
+        Numeric(10, 2, asdecimal=False), nullable=False
     )
-    wholesale_price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     lead_time_days: Mapped[int] = mapped_column(Integer, nullable=False, default=7)
 
     item: Mapped[Item] = relationship(
@@ -130,6 +134,7 @@ class CustomerAddress(Base):
     customer_id: Mapped[int] = mapped_column(
         ForeignKey("customers.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     label: Mapped[str] = mapped_column(String(50), nullable=False)
     street: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -151,9 +156,13 @@ class Purchase(Base):
     customer_id: Mapped[int] = mapped_column(
         ForeignKey("customers.id", ondelete="CASCADE"), nullable=False
     )
-    item_id: Mapped[int] = mapped_column(ForeignKey("items.id", ondelete="CASCADE"), nullable=False)
+    item_id: Mapped[int] = mapped_column(
+        ForeignKey("items.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
-    total_amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    total_amount: Mapped[float] = mapped_column(
+        Numeric(10, 2, asdecimal=False), nullable=False
+    )
     purchased_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -162,6 +171,7 @@ class Purchase(Base):
     shipping_address_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("customer_addresses.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
 
     customer: Mapped[Customer] = relationship(back_populates="purchases")
@@ -169,3 +179,13 @@ class Purchase(Base):
     shipping_address: Mapped[Optional[CustomerAddress]] = relationship(
         back_populates="purchases"
     )
+
+
+# Postgres does not index foreign keys on its own. This composite index serves both
+# customer lookups and "most recent purchases for a customer" queries, so customer_id
+# needs no separate index.
+Index(
+    "ix_purchases_customer_purchased_at",
+    Purchase.customer_id,
+    Purchase.purchased_at.desc(),
+)
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from collections.abc import Iterable
 from typing import List, Sequence
 
 from openai import AsyncOpenAI
 
-from .config import VLLMConfig
+from .config import VLLMConfig, default_vllm_config
+from .vector.cache import TTLCache
 
 DEFAULT_EMBEDDING_MODEL = "nomic-embed-text"
+DEFAULT_EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_BATCH_WINDOW_SECONDS = 0.005
+QUERY_VECTOR_CACHE_SIZE = 512
+QUERY_VECTOR_CACHE_TTL_SECONDS = 3600.0
+
+# Clients are reused across calls so the connection pool stays warm; they are bound to
+# the running event loop, so callers close them with ``close_embedding_clients``.
+_clients: dict[tuple[str, str], AsyncOpenAI] = {}
+_batchers: dict[tuple[str, str, str], _EmbeddingBatcher] = {}
 
 
 def _embedding_model() -> str:
@@ -21,28 +32,169 @@ def _embedding_model() -> str:
     )
 
 
+def _client_for(config: VLLMConfig) -> AsyncOpenAI:
+    key = (config.base_url, config.api_key)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = AsyncOpenAI(base_url=config.base_url, api_key=config.api_key)
+    return client
+
+
+async def close_embedding_clients() -> None:
+    """Close the cached embedding clients; call once before the event loop shuts down."""
+
+    clients = list(_clients.values())
+    _clients.clear()
+    _batchers.clear()
+    await asyncio.gather(*(client.close() for client in clients))
+
+
 async def _embed_async(
-    texts: List[str], *, config: VLLMConfig, model: str
+    texts: List[str], *, config: VLLMConfig, model: str, batch_size: int
 ) -> List[Sequence[float]]:
-    client = AsyncOpenAI(base_url=config.base_url, api_key=config.api_key)
+    client = _client_for(config)
     try:
-        response = await client.embeddings.create(model=model, input=texts)
-        return [item.embedding for item in response.data]
+        # Each request carries a whole batch in ``input`` so the server embeds it in one
+        # pass; the batches themselves are submitted concurrently.
+        # Leave ``encoding_format`` unset: the SDK then negotiates base64-packed float32
+        # vectors on the wire and decodes them itself, which is already the compact form.
+        responses = await asyncio.gather(
+            *(
+                client.embeddings.create(model=model, input=texts[start : start + batch_size])
+                for start in range(0, len(texts), batch_size)
+            )
+        )
+        return [item.embedding for response in responses for item in response.data]
     except Exception as e:
         print(f"Error during embedding: {e}")
         return []
-    finally:
-        await client.close()
 
 
 async def embed_contents(
-    contents: Iterable[str], *, config: VLLMConfig | None = None, model: str | None = None
+    contents: Iterable[str],
+    *,
+    config: VLLMConfig | None = None,
+    model: str | None = None,
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
 ) -> List[Sequence[float]]:
-    texts = [text for text in contents]
+    texts = list(contents)
     if not texts:
         return []
 
-    resolved_config = config or VLLMConfig()
+    resolved_config = config or default_vllm_config()
+    resolved_model = model or _embedding_model()
+
+    return await _embed_async(
+        texts,
+        config=resolved_config,
+        model=resolved_model,
+        batch_size=max(1, batch_size),
+    )
+
+
+class _EmbeddingBatcher:
+    """Coalesce concurrent single-text embedding requests into one batched call.
+
+    Requests arriving within ``max_wait`` seconds of the first pending one, up to
+    ``max_batch`` texts, share a single embeddings request. Identical texts share one
+    slot in the batch, and recent vectors are answered from memory.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: VLLMConfig,
+        model: str,
+        max_batch: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_wait: float = EMBEDDING_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        self._config = config
+        self._model = model
+        self._max_batch = max(1, max_batch)
+        self._max_wait = max_wait
+        self._pending: list[tuple[str, asyncio.Future[Sequence[float]]]] = []
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._waiting: dict[str, asyncio.Future[Sequence[float]]] = {}
+        self._recent: TTLCache[Sequence[float]] = TTLCache(
+            maxsize=QUERY_VECTOR_CACHE_SIZE, ttl=QUERY_VECTOR_CACHE_TTL_SECONDS
+        )
+
+    async def embed(self, text: str) -> Sequence[float]:
+        vector = self._recent.get(text)
+        if vector is not None:
+            return vector
+
+        future = self._waiting.get(text)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._waiting[text] = loop.create_future()
+            self._pending.append((text, future))
+            if len(self._pending) >= self._max_batch:
+                self._flush()
+            elif self._flush_timer is None:
+                self._flush_timer = loop.call_later(self._max_wait, self._flush)
+        # Shielded because the future may be shared: one caller giving up must not cancel
+        # it for the others.
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._embed_batch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _embed_batch(
+        self, batch: list[tuple[str, asyncio.Future[Sequence[float]]]]
+    ) -> None:
+        try:
+            vectors = await _embed_async(
+                [text for text, _ in batch],
+                config=self._config,
+                model=self._model,
+                batch_size=self._max_batch,
+            )
+            if len(vectors) != len(batch):
+                raise RuntimeError("Embedding endpoint returned no data.")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as exc:
+            # Every caller waits on its future; leaving one unresolved would hang it.
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for (text, future), vector in zip(batch, vectors, strict=True):
+                self._recent.put(text, vector)
+                if not future.done():
+                    future.set_result(vector)
+        finally:
+            for text, _ in batch:
+                self._waiting.pop(text, None)
+
+
+async def embed_query(
+    text: str,
+    *,
+    config: VLLMConfig | None = None,
+    model: str | None = None,
+) -> Sequence[float]:
+    """Embed a single text, sharing a request with other concurrent callers.
+
+    Raises ``RuntimeError`` when the embedding endpoint fails.
+    """
+
+    resolved_config = config or default_vllm_config()
     resolved_model = model or _embedding_model()
+    key = (resolved_config.base_url, resolved_config.api_key, resolved_model)
+    batcher = _batchers.get(key)
+    if batcher is None:
+        batcher = _batchers[key] = _EmbeddingBatcher(config=resolved_config, model=resolved_model)
+    return await batcher.embed(text)
 
-    return await _embed_async(texts, config=resolved_config, model=resolved_model)
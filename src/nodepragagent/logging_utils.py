@@ -29,14 +29,29 @@ class _LogContext:
         return response
 
     def log_success(self) -> None:
-        extra = dict(self._base_extra)
+        extra = self._base_extra
         if self._success_extra_fn is not None:
             extra_update = self._success_extra_fn(self._response)
-            if isinstance(extra_update, dict):
-                extra.update(extra_update)
+            if isinstance(extra_update, dict) and extra_update:
+                extra = {**self._base_extra, **extra_update}
         self._logger.info(self._success_message, extra=extra)
 
 
+class _NullLogContext:
+    """Stand-in used when INFO logging is disabled; records and logs nothing."""
+
+    __slots__ = ()
+
+    def record_response(self, response: Any) -> Any:
+        return response
+
+    def log_success(self) -> None:
+        pass
+
+
+_NULL_CONTEXT = _NullLogContext()
+
+
 @contextmanager
 def log_operation(
     *,
@@ -46,9 +61,19 @@ def log_operation(
     failure_message: str,
     base_extra: dict[str, Any],
     success_extra_fn: Callable[[Any], dict[str, Any]] | None = None,
-) -> Iterator[_LogContext]:
+) -> Iterator[_LogContext | _NullLogContext]:
     """Generic logging context manager to avoid repeated boilerplate."""
 
+    if not logger.isEnabledFor(logging.INFO):
+        # Skip building the context when start/success records would be dropped anyway;
+        # failures are still logged at ERROR level.
+        try:
+            yield _NULL_CONTEXT
+        except Exception:
+            logger.exception(failure_message, extra=base_extra)
+            raise
+        return
+
     logger.info(start_message, extra=base_extra)
     context = _LogContext(
         logger=logger,
@@ -1,6 +1,5 @@
 from typing import Any
-from dataclasses import dataclass
-import json
+from dataclasses import dataclass, fields, is_dataclass
 from openai.types.chat import (
     ChatCompletionAssistantMessageParam,
     ChatCompletionMessageFunctionToolCall,
@@ -8,58 +7,151 @@ from openai.types.chat import (
     ChatCompletionToolMessageParam,
     ChatCompletionUserMessageParam,
 )
+from openai.types.chat.chat_completion_message_function_tool_call_param import Function
 from pydantic import BaseModel
 
-
-def make_json_serializable(obj: Any) -> Any:
-    """Recursive function to make objects JSON serializable"""
-    if obj is None:
-        return None
-    elif isinstance(obj, (str, int, float, bool)):
-        # Try to parse string as JSON if it looks like a JSON object/array
-        if isinstance(obj, str):
-            try:
-                if (obj.startswith("{") and obj.endswith("}")) or (
-                    obj.startswith("[") and obj.endswith("]")
-                ):
-                    parsed = json.loads(obj)
-                    return make_json_serializable(parsed)
-            except json.JSONDecodeError:
-                pass
-        return obj
-    elif isinstance(obj, BaseModel):
-        return make_json_serializable(obj.model_dump(exclude_none=True))
-    elif isinstance(obj, (list, tuple)):
-        return [make_json_serializable(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {str(k): make_json_serializable(v) for k, v in obj.items()}
+from . import _json
+
+
+def dumps_serializable(obj: Any, *, indent: bool = False) -> str:
+    """Serialize ``obj`` to JSON, converting unsupported values only when needed."""
+
+    # The encoder walks plain containers natively and calls back only for foreign
+    # types; the full conversion pass is kept for what the hook cannot express, such as
+    # dict keys of unsupported types.
+    try:
+        return _json.dumps(obj, indent=indent, default=_json_default)
+    except (TypeError, ValueError):
+        return _json.dumps(_to_serializable(obj), indent=indent)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", exclude_none=True)
+    obj_dict = _attributes(value)
+    if obj_dict is None:
+        return str(value)
+    return {"_type": type(value).__name__, **obj_dict}
+
+
+def _attributes(value: Any) -> dict[str, Any] | None:
+    """Return an object's instance attributes, including slotted dataclass fields."""
+
+    try:
+        return value.__dict__
+    except AttributeError:
+        pass
+    if is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+    return None
+
+
+# A pending conversion: the slot ``parent[key]`` receives the converted ``value``.
+_Slot = tuple[Any, Any, Any]
+
+
+def _to_serializable(obj: Any) -> Any:
+    """Convert ``obj`` into plain JSON types without recursing.
+
+    Containers are expanded from an explicit stack so deep payloads cannot hit the
+    recursion limit. Objects reached twice share one converted copy.
+    """
+
+    root: list[Any] = [None]
+    stack: list[_Slot] = [(root, 0, obj)]
+    converted: dict[int, Any] = {}
+    while stack:
+        parent, key, value = stack.pop()
+        handler = _HANDLERS.get(type(value), _convert_other)
+        handler(parent, key, value, stack, converted)
+    return root[0]
+
+
+def _copy_scalar(
+    parent: Any, key: Any, value: Any, stack: list[_Slot], converted: dict[int, Any]
+) -> None:
+    parent[key] = value
+
+
+def _expand_dict(
+    parent: Any, key: Any, value: Any, stack: list[_Slot], converted: dict[int, Any]
+) -> None:
+    if id(value) in converted:
+        parent[key] = converted[id(value)]
+        return
+    # Pre-seed the keys so the stack's LIFO order does not reorder the output.
+    result = converted[id(value)] = parent[key] = dict.fromkeys(str(k) for k in value)
+    stack.extend((result, str(k), v) for k, v in value.items())
+
+
+def _expand_sequence(
+    parent: Any, key: Any, value: Any, stack: list[_Slot], converted: dict[int, Any]
+) -> None:
+    if id(value) in converted:
+        parent[key] = converted[id(value)]
+        return
+    result = converted[id(value)] = parent[key] = [None] * len(value)
+    stack.extend((result, index, item) for index, item in enumerate(value))
+
+
+def _convert_other(
+    parent: Any, key: Any, value: Any, stack: list[_Slot], converted: dict[int, Any]
+) -> None:
+    if isinstance(value, (str, int, float, bool)):
+        parent[key] = value
+    elif isinstance(value, BaseModel):
+        # JSON mode has pydantic-core emit JSON-native values, so the dump needs no walk.
+        parent[key] = value.model_dump(mode="json", exclude_none=True)
+    elif isinstance(value, (list, tuple)):
+        _expand_sequence(parent, key, value, stack, converted)
+    elif isinstance(value, dict):
+        _expand_dict(parent, key, value, stack, converted)
+    elif id(value) in converted:
+        parent[key] = converted[id(value)]
     else:
-        try:
-            obj_dict = obj.__dict__
-        except AttributeError:
+        obj_dict = _attributes(value)
+        if obj_dict is None:
             # For any other type, convert to string
-            return str(obj)
+            parent[key] = str(value)
+            return
 
         # For custom objects, convert their __dict__ to a serializable format
-        return {
-            "_type": obj.__class__.__name__,
-            **{k: make_json_serializable(v) for k, v in obj_dict.items()},
-        }
+        result: dict[str, Any] = {"_type": type(value).__name__}
+        converted[id(value)] = parent[key] = result
+        if obj_dict:
+            # Values are filled in as the stack drains; only the key slots are set here.
+            for k in obj_dict:
+                result[k] = None
+            stack.extend((result, k, v) for k, v in obj_dict.items())
+
+
+# Exact-type dispatch covers the common JSON shapes with one dict lookup; subclasses and
+# everything else fall through to ``_convert_other``.
+_HANDLERS = {
+    type(None): _copy_scalar,
+    str: _copy_scalar,
+    int: _copy_scalar,
+    float: _copy_scalar,
+    bool: _copy_scalar,
+    dict: _expand_dict,
+    list: _expand_sequence,
+    tuple: _expand_sequence,
+}
 
 
 def system_message(content: str) -> ChatCompletionSystemMessageParam:
-    return ChatCompletionSystemMessageParam(role="system", content=content)
+    return {"role": "system", "content": content}
 
 
 def user_message(content: str) -> ChatCompletionUserMessageParam:
-    return ChatCompletionUserMessageParam(role="user", content=content)
+    return {"role": "user", "content": content}
 
 
 def assistant_message(content: str) -> ChatCompletionAssistantMessageParam:
-    return ChatCompletionAssistantMessageParam(role="assistant", content=content)
+    return {"role": "assistant", "content": content}
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ToolCall:
     name: str
     arguments: Any
@@ -69,22 +161,14 @@ class ToolCall:
         serialized_arguments = (
             self.arguments
             if isinstance(self.arguments, str)
-            else json.dumps(make_json_serializable(self.arguments))
+            else dumps_serializable(self.arguments)
         )
 
-        return ChatCompletionAssistantMessageParam(
-            role="assistant",
-            tool_calls=[
-                {
-                    "id": self.id,
-                    "type": "function",
-                    "function": {
-                        "name": self.name,
-                        "arguments": serialized_arguments,
-                    },
-                }
-            ],
-        )
+        function: Function = {"name": self.name, "arguments": serialized_arguments}
+        return {
+            "role": "assistant",
+            "tool_calls": [{"id": self.id, "type": "function", "function": function}],
+        }
 
     @classmethod
     def from_openai_tool_call(cls, tool_call: ChatCompletionMessageFunctionToolCall) -> "ToolCall":
@@ -97,7 +181,7 @@ class ToolCall:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ToolMessage:
     tool_call_id: str
     content: Any
@@ -108,10 +192,6 @@ class ToolMessage:
         elif isinstance(self.content, str):
             serialized_content = self.content
         else:
-            serialized_content = json.dumps(make_json_serializable(self.content))
+            serialized_content = dumps_serializable(self.content)
 
-        return ChatCompletionToolMessageParam(
-            role="tool",
-            tool_call_id=self.tool_call_id,
-            content=serialized_content,
-        )
+        return {"role": "tool", "tool_call_id": self.tool_call_id, "content": serialized_content}
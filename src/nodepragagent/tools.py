@@ -2,30 +2,44 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
 import os
+import re
 import sys
+import weakref
 from dataclasses import dataclass
-from typing import Any, Awaitable, Dict, List, Optional, Protocol, Union
-
-from pydantic import BaseModel, Field, ConfigDict
-
-from sqlalchemy import text
-from sqlalchemy.engine import Engine
-from sqlalchemy.exc import SQLAlchemyError
-from weaviate.connect import ConnectionParams
-
-import weaviate 
-from weaviate.collections.classes.filters import Filter 
-from weaviate.collections.classes.grpc import MetadataQuery 
-from weaviate.exceptions import WeaviateBaseError
+from decimal import Decimal
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Union,
+)
 
 from openai.types.chat import ChatCompletionFunctionToolParam
 from openai.types.shared_params import FunctionDefinition
-from .db import Base, create_postgres_engine
-from .embeddings import embed_contents
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import InvalidRequestError, SQLAlchemyError
+
+from .db import Base, get_async_engine, get_engine, postgres_url
+from .embeddings import embed_query
 from .errors import LLMError
-from .utils import serialize_schema
+from .utils import read_stdin, serialize_schema
+from .vector.cache import SemanticQueryCache, TTLCache
+
+# weaviate pulls in gRPC stubs and is slow to import; only the Weaviate tool needs it, so
+# it is imported on first use.
+if TYPE_CHECKING:
+    import weaviate
+    from sqlalchemy.ext.asyncio import AsyncEngine
 
 WEAVIATE_CLASS = "ProductInsight"
 POSTGRES_SCHEMA = serialize_schema(Base())
@@ -77,15 +91,16 @@ class Tool:
     args_model: type[BaseModel]
     callback: ToolCallback
 
-    @property
+    # cached_property stores into the instance __dict__ directly, so it works on a frozen
+    # dataclass; each schema is built once per tool.
+    @functools.cached_property
     def parameters(self) -> Dict[str, Any]:
         """Return the OpenAPI-compatible JSON schema for the tool parameters."""
 
         return self.args_model.model_json_schema()
 
-    def to_openai_tool(self) -> ChatCompletionFunctionToolParam:
-        """Return the ChatCompletions tool specification for this tool."""
-
+    @functools.cached_property
+    def _openai_tool(self) -> ChatCompletionFunctionToolParam:
         return ChatCompletionFunctionToolParam(
             type="function",
             function=FunctionDefinition(
@@ -95,25 +110,15 @@ class Tool:
             ),
         )
 
+    def to_openai_tool(self) -> ChatCompletionFunctionToolParam:
+        """Return the ChatCompletions tool specification for this tool."""
 
-def _semantic_score(additional: Dict[str, Any]) -> Optional[float]:
-    """Translate Weaviate `_additional` metadata into a relevance score."""
-
-    certainty = additional.get("certainty")
-    if certainty is not None:
-        try:
-            return float(certainty)
-        except (TypeError, ValueError):
-            return None
+        return self._openai_tool
 
-    distance = additional.get("distance")
-    if distance is not None:
-        try:
-            return 1.0 - float(distance)
-        except (TypeError, ValueError):
-            return None
+    def validate(self, arguments: Dict[str, Any]) -> BaseModel:
+        """Validate raw tool arguments; raises ``pydantic.ValidationError`` on bad input."""
 
-    return None
+        return self.args_model.model_validate(arguments)
 
 
 def final_answer(*, answer: str, sources: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -125,7 +130,23 @@ def final_answer(*, answer: str, sources: Optional[List[str]] = None) -> Dict[st
     return payload
 
 
-def request_user_input(*, prompt: str, allow_empty: bool = False) -> Dict[str, Any]:
+# Interactive prompts are asked one at a time. Concurrent tool calls, from one turn or
+# from several batch agents, would otherwise interleave their questions and race for the
+# same stdin lines. Keyed by loop because an asyncio.Lock is bound to the loop it waits on.
+_user_input_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _user_input_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    lock = _user_input_locks.get(loop)
+    if lock is None:
+        lock = _user_input_locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def request_user_input(*, prompt: str, allow_empty: bool = False) -> Dict[str, Any]:
     """Prompt the end user for additional input and return their response."""
 
     question = prompt.strip() or "Please provide additional information:"
@@ -140,7 +161,10 @@ def request_user_input(*, prompt: str, allow_empty: bool = False) -> Dict[str, A
         }
 
     try:
-        answer = input(f"{question}\n> ")
+        # Other tool calls keep running while the user types. Ctrl-C cancels this
+        # await along with the rest of the turn.
+        async with _user_input_lock():
+            answer = await read_stdin(functools.partial(input, f"{question}\n> "))
     except EOFError:
         return {
             "response": None,
@@ -149,14 +173,6 @@ def request_user_input(*, prompt: str, allow_empty: bool = False) -> Dict[str, A
                 message="Input stream closed while waiting for user response.",
             ).as_dict(),
         }
-    except KeyboardInterrupt:
-        return {
-            "response": None,
-            "error": LLMError(
-                reason="input_cancelled",
-                message="User cancelled the input request.",
-            ).as_dict(),
-        }
 
     if not allow_empty and not answer.strip():
         return {
@@ -170,13 +186,76 @@ def request_user_input(*, prompt: str, allow_empty: bool = False) -> Dict[str, A
     return {"response": answer}
 
 
-def _postgres_engine() -> Engine:
-    """Create a SQLAlchemy engine for Postgres using environment variables."""
+# URLs that cannot run on the asyncio extension, so the engine lookup is not retried per
+# call.
+_sync_only_urls: set[str] = set()
+
+
+def _postgres_engine() -> AsyncEngine | Engine:
+    """Return the shared async engine, or the sync one when asyncio is unavailable."""
 
-    return create_postgres_engine()
+    url = postgres_url()
+    if url not in _sync_only_urls:
+        try:
+            return get_async_engine(url)
+        except (InvalidRequestError, ImportError, ValueError):
+            # A sync-only driver (``sqlite://``, ``postgresql+psycopg2://``) or a platform
+            # without greenlet; queries run on a thread instead.
+            _sync_only_urls.add(url)
+    return get_engine(url)
+
+
+_ROW_QUERY = re.compile(r"^\s*(select|with)\b", re.IGNORECASE)
+_DATA_MODIFYING = re.compile(r"\b(insert|update|delete|merge|into)\b", re.IGNORECASE)
+
+
+def _with_row_limit(sql: str, limit: int) -> str:
+    """Wrap a single read query so the server stops after ``limit`` rows.
+
+    Anything else (DML, multiple statements, ``SELECT ... INTO`` and data-modifying
+    CTEs, which Postgres only allows at the top level) is returned unchanged.
+    """
+
+    statement = sql.rstrip().rstrip(";").rstrip()
+    if ";" in statement or not _ROW_QUERY.match(statement):
+        return sql
+    if _DATA_MODIFYING.search(statement):
+        return sql
+    # The newlines keep a trailing ``--`` comment from swallowing the closing paren.
+    return f"SELECT * FROM (\n{statement}\n) AS _agent_rows LIMIT {limit}"
+
+
+def _execute_query(connection: Connection, sql: str, limit: int) -> QueryPostgresResult:
+    # One extra row tells us whether the result was cut off; the server never produces
+    # the rest.
+    result = connection.execute(text(_with_row_limit(sql, limit + 1)))
+    if not result.returns_rows:
+        return QueryPostgresResult(rows=[], rowcount=result.rowcount)
+
+    # Plain tuples zipped with the column names once are cheaper than RowMappings.
+    # Raw SQL bypasses the ORM's float columns, so NUMERIC values arrive as Decimal and
+    # are converted here to stay JSON numbers.
+    keys = tuple(result.keys())
+    fetched = result.fetchmany(limit + 1)
+    rows = [
+        {
+            key: float(value) if type(value) is Decimal else value
+            for key, value in zip(keys, row, strict=True)
+        }
+        for row in fetched[:limit]
+    ]
+    payload: Dict[str, Any] = {"rows": rows}
+    if len(fetched) > limit:
+        payload["truncated"] = True
+    return QueryPostgresResult(**payload)
 
 
-def query_postgres(*, sql: str, limit: int = 50) -> QueryPostgresResult:
+def _execute_query_sync(engine: Engine, sql: str, limit: int) -> QueryPostgresResult:
+    with engine.begin() as connection:
+        return _execute_query(connection, sql, limit)
+
+
+async def query_postgres(*, sql: str, limit: int = 50) -> QueryPostgresResult:
     """Run a SQL statement and return a JSON-serializable payload."""
     # TODO query sanification
 
@@ -192,7 +271,6 @@ def query_postgres(*, sql: str, limit: int = 50) -> QueryPostgresResult:
 
     capped_limit = max(1, min(limit, 200))
 
-    engine: Engine | None = None
     try:
         engine = _postgres_engine()
     except Exception as exc:
@@ -205,23 +283,12 @@ def query_postgres(*, sql: str, limit: int = 50) -> QueryPostgresResult:
         )
 
     try:
-        with engine.begin() as connection:
-            statement = text(sql)
-            result = connection.execute(statement)
-            if not result.returns_rows:
-                return QueryPostgresResult(rows=[], rowcount=result.rowcount)
-
-            rows = []
-            truncated = False
-            for idx, row in enumerate(result):
-                if idx >= capped_limit:
-                    truncated = True
-                    break
-                rows.append(dict(row._mapping))
-            payload: Dict[str, Any] = {"rows": rows}
-            if truncated:
-                payload["truncated"] = True
-            return QueryPostgresResult(**payload)
+        if isinstance(engine, Engine):
+            return await asyncio.to_thread(_execute_query_sync, engine, sql, capped_limit)
+        # Awaiting the driver lets this query overlap with Weaviate and LLM calls in the
+        # same turn instead of holding an executor thread.
+        async with engine.begin() as connection:
+            return await connection.run_sync(_execute_query, sql, capped_limit)
     except SQLAlchemyError as exc:
         return QueryPostgresResult(
             rows=[],
@@ -238,16 +305,20 @@ def query_postgres(*, sql: str, limit: int = 50) -> QueryPostgresResult:
                 message=str(exc),
             ),
         )
-    finally:
-        if engine is not None:
-            engine.dispose()
 
 
 def _weaviate_client() -> weaviate.WeaviateAsyncClient:
-    """Construct a Weaviate client from environment variables, REST-only (no gRPC)."""
+    """Construct a Weaviate client from environment variables.
+
+    Queries and batch inserts travel over gRPC, so the gRPC port must be reachable.
+    """
+
+    import weaviate
+    from weaviate.connect import ConnectionParams
 
     url = os.getenv("WEAVIATE_URL", "http://localhost:8080")
-    connection_params = ConnectionParams.from_url(url, grpc_port=50051)
+    grpc_port = int(os.getenv("WEAVIATE_GRPC_PORT", "50051"))
+    connection_params = ConnectionParams.from_url(url, grpc_port=grpc_port)
 
     return weaviate.WeaviateAsyncClient(
         connection_params=connection_params,
@@ -256,11 +327,66 @@ def _weaviate_client() -> weaviate.WeaviateAsyncClient:
     )
 
 
-async def query_weaviate(
-    *, query: str, limit: int = 3, category: Optional[str] = None
-) -> QueryWeaviateResult:
+# Near-duplicate queries (agent retries, re-plans) reuse earlier results instead of
+# searching again.
+_SEMANTIC_QUERY_CACHE: SemanticQueryCache[tuple[WeaviateDocument, ...]] = SemanticQueryCache()
+_EXACT_QUERY_CACHE: TTLCache[tuple[WeaviateDocument, ...]] = TTLCache(maxsize=256)
+
+_shared_weaviate: weaviate.WeaviateAsyncClient | None = None
+_shared_weaviate_lock = asyncio.Lock()
+
+
+async def _connected_weaviate_client() -> weaviate.WeaviateAsyncClient:
+    """Return the process-wide Weaviate client, connecting it on first use."""
+
+    global _shared_weaviate
+    if _shared_weaviate is not None:
+        return _shared_weaviate
+    async with _shared_weaviate_lock:
+        if _shared_weaviate is None:
+            client = _weaviate_client()
+            await client.connect()
+            _shared_weaviate = client
+        return _shared_weaviate
+
+
+# Whether each collection has a server-side vectorizer; schema changes need a restart.
+_server_vectorizer: dict[str, bool] = {}
+
+
+async def _has_server_vectorizer(collection: Any) -> bool:
+    """Return whether ``collection`` can embed query text itself (``near_text``)."""
+
+    known = _server_vectorizer.get(collection.name)
+    if known is None:
+        try:
+            config = await collection.config.get(simple=True)
+        except Exception:
+            # Fall back to client-side embeddings; not cached so a later call retries.
+            return False
+        vectorizer = getattr(config.vectorizer, "value", config.vectorizer)
+        known = _server_vectorizer[collection.name] = vectorizer not in (None, "none")
+    return known
+
+
+async def close_weaviate_client() -> None:
+    """Close the shared Weaviate client; call once before the event loop shuts down."""
+
+    global _shared_weaviate, _shared_weaviate_lock
+    client, _shared_weaviate = _shared_weaviate, None
+    # The lock may be bound to the loop that is shutting down.
+    _shared_weaviate_lock = asyncio.Lock()
+    _server_vectorizer.clear()
+    if client is not None:
+        await client.close()
+
+
+async def query_weaviate(*, query: str, limit: int = 3) -> QueryWeaviateResult:
     """Query Weaviate for documents related to the supplied query string."""
 
+    from weaviate.collections.classes.grpc import MetadataQuery
+    from weaviate.exceptions import WeaviateBaseError
+
     normalized_limit = max(1, min(limit, 10))
     query = query.strip()
     if not query:
@@ -272,22 +398,14 @@ async def query_weaviate(
             ),
         )
 
-    client = _weaviate_client()
-
-    try:
-        query_vector = (await embed_contents([query]))[0]
-    except Exception as exc:
-        return QueryWeaviateResult(
-            results=[],
-            error=LLMError(
-                reason="embedding_failure",
-                message="Failed to embed query.",
-                details=str(exc),
-            ),
-        )
+    # Identical requests are answered before paying for an embedding call.
+    exact_key = (query.lower(), normalized_limit)
+    cached_documents = _EXACT_QUERY_CACHE.get(exact_key)
+    if cached_documents is not None:
+        return QueryWeaviateResult.model_construct(results=list(cached_documents))
 
     try:
-        await client.connect()
+        client = await _connected_weaviate_client()
     except Exception as exc:  # pragma: no cover - connection issues
         return QueryWeaviateResult(
             results=[],
@@ -298,22 +416,44 @@ async def query_weaviate(
             ),
         )
 
-    filters = None
-    # TODO disabled category for now
-    # if category:
-    #     normalized_category = category.strip()
-    #     if normalized_category:
-    #         filters = Filter.by_property("category").equal(normalized_category)
+    collection = client.collections.get(WEAVIATE_CLASS)
+    # Semantic hits must come from a search with the same limit.
+    cache_scope = normalized_limit
+    query_vector: Optional[Sequence[float]] = None
+    if not await _has_server_vectorizer(collection):
+        try:
+            query_vector = await embed_query(query)
+        except Exception as exc:
+            return QueryWeaviateResult(
+                results=[],
+                error=LLMError(
+                    reason="embedding_failure",
+                    message="Failed to embed query.",
+                    details=str(exc),
+                ),
+            )
 
+        cached_documents = _SEMANTIC_QUERY_CACHE.get(query_vector, cache_scope)
+        if cached_documents is not None:
+            _EXACT_QUERY_CACHE.put(exact_key, cached_documents)
+            return QueryWeaviateResult.model_construct(results=list(cached_documents))
+
+    search_options: Dict[str, Any] = {
+        "limit": normalized_limit,
+        "return_properties": ["title", "category", "content"],
+        # Only certainty is surfaced to the model; distance would be dead weight.
+        "return_metadata": MetadataQuery(certainty=True),
+    }
     try:
-        collection = client.collections.get(WEAVIATE_CLASS)
-        query_result = await collection.query.near_vector(  # type: ignore[attr-defined]
-            near_vector=query_vector,
-            limit=normalized_limit,
-            filters=filters,
-            return_properties=["title", "category", "content"],
-            return_metadata=MetadataQuery(distance=True, certainty=True),
-        )
+        if query_vector is None:
+            # The collection embeds the text itself, saving the embeddings round-trip.
+            query_result = await collection.query.near_text(  # type: ignore[attr-defined]
+                query=query, **search_options
+            )
+        else:
+            query_result = await collection.query.near_vector(  # type: ignore[attr-defined]
+                near_vector=query_vector, **search_options
+            )
     except WeaviateBaseError as exc:
         return QueryWeaviateResult(
             results=[],
@@ -330,54 +470,38 @@ async def query_weaviate(
                 message=str(exc),
             ),
         )
-    finally:
-        await client.close()
 
-    documents = []
+    # The v4 client returns typed objects: ``properties`` is a dict and
+    # ``metadata.certainty`` a float or None, so no defensive lookups are needed.
+    construct = WeaviateDocument.model_construct
+    documents: List[WeaviateDocument] = []
     try:
-        objects = query_result.objects
-    except AttributeError:
-        objects = []
-
-    for obj in objects or []:
-        try:
+        for obj in query_result.objects:
             properties = obj.properties
-        except AttributeError:
-            properties = {}
-        properties = properties or {}
-
-        try:
-            metadata = obj.metadata
-        except AttributeError:
-            metadata = None
-
-        if isinstance(metadata, dict):
-            certainty_value = metadata.get("certainty")
-        elif metadata is None:
-            certainty_value = None
-        else:
-            try:
-                certainty_value = metadata.certainty
-            except AttributeError:
-                certainty_value = None
-
-        additional = {"certainty": certainty_value}
-        certainty = additional["certainty"]
-        if certainty is not None:
-            try:
-                certainty = round(float(certainty), 2)
-            except (TypeError, ValueError):
-                certainty = additional["certainty"]
-        documents.append(
-            WeaviateDocument(
-                title=properties.get("title"),
-                category=properties.get("category"),
-                content=properties.get("content"),
-                certainty=certainty,
+            certainty = obj.metadata.certainty
+            documents.append(
+                construct(
+                    title=properties.get("title"),
+                    category=properties.get("category"),
+                    content=properties.get("content"),
+                    certainty=None if certainty is None else round(certainty, 2),
+                )
             )
+    except AttributeError as exc:
+        return QueryWeaviateResult(
+            results=[],
+            error=LLMError(
+                reason="unexpected_response",
+                message="Weaviate returned an unexpected response shape.",
+                details=str(exc),
+            ),
         )
 
-    return QueryWeaviateResult(results=documents)
+    cached_documents = tuple(documents)
+    if query_vector is not None:
+        _SEMANTIC_QUERY_CACHE.put(query_vector, cache_scope, cached_documents)
+    _EXACT_QUERY_CACHE.put(exact_key, cached_documents)
+    return QueryWeaviateResult.model_construct(results=documents)
 
 
 
@@ -415,10 +539,6 @@ class QueryWeaviateArgs(BaseModel):
         le=10,
         description="Maximum number of documents to return (default 3).",
     )
-    category: Optional[str] = Field(
-        None,
-        description="Optional category filter; only documents with this category will be returned.",
-    )
 
 
 QUERY_WEAVIATE_TOOL = Tool(
@@ -482,5 +602,29 @@ ALL_TOOLS: tuple[Tool, ...] = (
 
 TOOLS: dict[str, Tool] = {tool.name: tool for tool in ALL_TOOLS}
 
-OPENAI_CHAT_TOOLS: list[ChatCompletionFunctionToolParam] = [
-    tool.to_openai_tool() for tool in ALL_TOOLS]
+# Tool specs are static: build them once at import and share the same immutable sequence
+# with every agent.
+OPENAI_CHAT_TOOLS: tuple[ChatCompletionFunctionToolParam, ...] = tuple(
+    tool.to_openai_tool() for tool in ALL_TOOLS
+)
+
+
+__all__ = [
+    "ALL_TOOLS",
+    "FINAL_ANSWER_TOOL",
+    "FINAL_ANSWER_TOOL_NAME",
+    "OPENAI_CHAT_TOOLS",
+    "POSTGRES_SCHEMA",
+    "QueryPostgresResult",
+    "QueryWeaviateResult",
+    "TOOLS",
+    "Tool",
+    "ToolCallback",
+    "WEAVIATE_CLASS",
+    "WeaviateDocument",
+    "close_weaviate_client",
+    "final_answer",
+    "query_postgres",
+    "query_weaviate",
+    "request_user_input",
+]
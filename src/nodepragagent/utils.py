@@ -1,11 +1,14 @@
-import json
+import asyncio
+import threading
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import DeclarativeBase
 from openai.types.chat import ChatCompletionFunctionToolParam
 
+from . import _json
+
 
 class MessageRole(str, Enum):
     USER = "user"
@@ -38,41 +41,94 @@ def _format_payload(payload: object) -> str:
         return payload
 
     try:
-        return json.dumps(payload, indent=2, sort_keys=True)
+        return _json.dumps(payload, indent=True, sort_keys=True)
     except (TypeError, ValueError):
         return str(payload)
 
 
+def _print_model_request(prefix: str, payload: dict[str, Any]) -> None:
+    print(f"{prefix}-> calling model")
+
+
+def _print_model_response(prefix: str, payload: dict[str, Any]) -> None:
+    content = payload.get("content", "")
+    print(f"{prefix}Model> {content}")
+
+
+def _print_tool_call(prefix: str, payload: dict[str, Any]) -> None:
+    tool_name = payload.get("tool_name", "unknown")
+    args = _format_payload(payload.get("arguments"))
+    tool_id = payload.get("tool_call_id")
+    suffix = f" (id: {tool_id})" if tool_id else ""
+    print(f"{prefix}Tool> {tool_name}{suffix}\n{args}")
+
+
+def _print_tool_result(prefix: str, payload: dict[str, Any]) -> None:
+    tool_name = payload.get("tool_name", "unknown")
+    if tool_name == "final_answer":
+        return
+    result = _format_payload(payload.get("response"))
+    print(f"{prefix}Tool< {tool_name}\n{result}")
+
+
+def _print_reasoning(prefix: str, payload: dict[str, Any]) -> None:
+    reasoning = payload.get("response_reasoning")
+    if reasoning:
+        formatted_reasoning = _format_payload(reasoning)
+        print(f"{prefix}<-- model reasoning\n{formatted_reasoning}")
+
+
+# Events without an entry (user messages, max iterations) are not printed.
+_EVENT_PRINTERS: dict[ReporterEvent, Callable[[str, dict[str, Any]], None]] = {
+    ReporterEvent.MODEL_REQUEST: _print_model_request,
+    ReporterEvent.MODEL_RESPONSE: _print_model_response,
+    ReporterEvent.TOOL_CALL: _print_tool_call,
+    ReporterEvent.TOOL_RESULT: _print_tool_result,
+    ReporterEvent.REASONING: _print_reasoning,
+}
+
+
 def cli_event_printer(event: ReporterEvent, payload: dict[str, Any]) -> None:
     """Print VLLM client events in a human-friendly format."""
 
+    printer = _EVENT_PRINTERS.get(event)
+    if printer is None:
+        return
     iteration = payload.get("iteration")
     prefix = f"[iter {iteration}] " if iteration is not None else ""
+    printer(prefix, payload)
 
-    if event is ReporterEvent.USER_MESSAGE:
-        return
-    if event is ReporterEvent.MODEL_REQUEST:
-        print(f"{prefix}-> calling model")
-    elif event is ReporterEvent.MODEL_RESPONSE:
-        content = payload.get("content", "")
-        print(f"{prefix}Model> {content}")
-    elif event is ReporterEvent.TOOL_CALL:
-        tool_name = payload.get("tool_name", "unknown")
-        args = _format_payload(payload.get("arguments"))
-        tool_id = payload.get("tool_call_id")
-        suffix = f" (id: {tool_id})" if tool_id else ""
-        print(f"{prefix}Tool> {tool_name}{suffix}\n{args}")
-    elif event is ReporterEvent.TOOL_RESULT:
-        tool_name = payload.get("tool_name", "unknown")
-        if tool_name == "final_answer":
+
+async def read_stdin(read: Callable[[], str]) -> str:
+    """Run a blocking stdin read on a daemon thread and await its result.
+
+    The default executor would be joined at shutdown, so a read still waiting for a
+    newline would keep Ctrl-C from exiting.
+    """
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def settle(line: str | None, error: BaseException | None) -> None:
+        if future.done():
             return
-        result = _format_payload(payload.get("response"))
-        print(f"{prefix}Tool< {tool_name}\n{result}")
-    elif event is ReporterEvent.REASONING:
-        reasoning = payload.get("response_reasoning")
-        if reasoning:
-            formatted_reasoning = _format_payload(reasoning)
-            print(f"{prefix}<-- model reasoning\n{formatted_reasoning}")
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line or "")
+
+    def worker() -> None:
+        try:
+            line, error = read(), None
+        except BaseException as exc:
+            line, error = None, exc
+        try:
+            loop.call_soon_threadsafe(settle, line, error)
+        except RuntimeError:
+            pass  # The loop closed while we were blocked; nobody is waiting.
+
+    threading.Thread(target=worker, name="stdin-reader", daemon=True).start()
+    return await future
 
 
 def serialize_schema(base_model: DeclarativeBase) -> Dict[str, Dict[str, Any]]:
@@ -0,0 +1,135 @@
+"""In-process caches for vector search results."""
+
+from __future__ import annotations
+
+import math
+import operator
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+DEFAULT_CACHE_SIZE = 128
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+
+
+@dataclass(frozen=True, slots=True)
+class _SemanticEntry(Generic[T]):
+    vector: tuple[float, ...]
+    scope: Hashable
+    value: T
+    expires_at: float
+
+
+def _normalize(vector: Sequence[float]) -> tuple[float, ...] | None:
+    norm = math.sqrt(math.fsum(component * component for component in vector))
+    if norm == 0.0:
+        return None
+    return tuple(component / norm for component in vector)
+
+
+class SemanticQueryCache(Generic[T]):
+    """Cache results by query embedding, returning hits above a cosine-similarity threshold.
+
+    Entries only match lookups with an equal ``scope`` (for example the result limit and
+    filters), expire after ``ttl`` seconds, and are evicted least-recently-used first.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = threshold
+        self._maxsize = max(1, maxsize)
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[int, _SemanticEntry[T]] = OrderedDict()
+        self._next_key = 0
+
+    def get(self, vector: Sequence[float], scope: Hashable) -> T | None:
+        normalized = _normalize(vector)
+        if normalized is None:
+            return None
+
+        now = self._clock()
+        best_key: int | None = None
+        best_score = self._threshold
+        for key, entry in list(self._entries.items()):
+            if entry.expires_at <= now:
+                del self._entries[key]
+                continue
+            if entry.scope != scope:
+                continue
+            score = sum(map(operator.mul, normalized, entry.vector))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key].value
+
+    def put(self, vector: Sequence[float], scope: Hashable, value: T) -> None:
+        normalized = _normalize(vector)
+        if normalized is None:
+            return
+
+        self._entries[self._next_key] = _SemanticEntry(
+            vector=normalized,
+            scope=scope,
+            value=value,
+            expires_at=self._clock() + self._ttl,
+        )
+        self._next_key += 1
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class TTLCache(Generic[T]):
+    """Small LRU mapping whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = max(1, maxsize)
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[T, float]] = OrderedDict()
+
+    def get(self, key: Hashable) -> T | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: T) -> None:
+        self._entries[key] = (value, self._clock() + self._ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+__all__ = ["SemanticQueryCache", "TTLCache"]
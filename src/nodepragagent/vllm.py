@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 import asyncio
-import functools
+import inspect
 import json
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Sequence
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, Omit, omit
 from openai.types.chat import (
     ChatCompletionMessageParam,
     ChatCompletionFunctionToolParam,
     ChatCompletionMessageFunctionToolCall,
     ChatCompletionMessageCustomToolCall
 )
+from . import _json
 from .utils import ReporterEvent, get_tool_name
 
 from .memory import (
@@ -22,7 +24,7 @@ from .memory import (
     assistant_message,
     system_message,
     user_message,
-    make_json_serializable,
+    dumps_serializable,
 )
 from pydantic import BaseModel, ValidationError
 
@@ -34,6 +36,8 @@ EventPayload = Dict[str, Any]
 EventReporter = Callable[[ReporterEvent, EventPayload], None]
 
 MAX_ITERATIONS = 10
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
 
 class SearchAgent:
     """Thin wrapper around the OpenAI client so we can mock responses in tests."""
@@ -46,14 +50,24 @@ class SearchAgent:
         system_prompt: str | None = None,
     ) -> None:
         self.config = config or DeepSeekConfig()
+        # One pooled HTTP client per agent keeps connections alive across turns.
         self._client = AsyncOpenAI(
-            base_url=self.config.base_url, api_key=self.config.api_key
+            base_url=self.config.base_url,
+            api_key=self.config.api_key,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                )
+            ),
         )
         self._reporter = reporter
         if system_prompt is None:
             raise ValueError("A system prompt must be provided.")
         prompt = system_prompt
         self.system_prompt = prompt
+        # History is append-only and always starts with this exact system message, so every
+        # request shares a stable token prefix that servers with prefix caching can reuse.
         self.history: List[ChatCompletionMessageParam] = [system_message(prompt)]
         self.tool_call_records: List[ToolCall] = []
         self.is_final_answer = False
@@ -64,6 +78,10 @@ class SearchAgent:
             for tool in provided_tools
             if get_tool_name(tool) != FINAL_ANSWER_TOOL_NAME
         ]
+        # Let the model batch independent tool calls into a single turn when supported.
+        self._parallel_tool_calls: bool | Omit = (
+            True if self.tool_spec and self.config.supports_parallel_tool_calls else omit
+        )
 
 
     async def generate_from_messages(
@@ -79,146 +97,170 @@ class SearchAgent:
         self._log_event(ReporterEvent.USER_MESSAGE, message=message)
         self.history.append(user_message(message))
 
-        try:
-            it = 0
-            while it < MAX_ITERATIONS:
-                self._log_event(
-                    ReporterEvent.MODEL_REQUEST,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                )
+        it = 0
+        while it < MAX_ITERATIONS:
+            self._log_event(
+                ReporterEvent.MODEL_REQUEST,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-                response = await self._client.chat.completions.create(
-                    model=self.config.model,
-                    messages=self.history,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    tools=self.tool_spec,
-                    tool_choice="auto",
-                )
+            response = await self._client.chat.completions.create(
+                model=self.config.model,
+                messages=self.history,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                tools=self.tool_spec,
+                tool_choice="auto",
+                parallel_tool_calls=self._parallel_tool_calls,
+            )
 
-                final_content: str | list[dict[str, Any]] | None = None
-                for choice in response.choices:
-                    msg = choice.message
-                    if msg.content:
-                        self._log_event(
-                            ReporterEvent.REASONING,
-                            response_reasoning=msg.model_extra.get("reasoning", None) if msg.model_extra is not None else None,
-                        )
-                        self._log_event(ReporterEvent.MODEL_RESPONSE, content=msg.content)
-                        serialized_content = (
-                            msg.content
-                            if isinstance(msg.content, str)
-                            else json.dumps(make_json_serializable(msg.content))
-                        )
-                        self.history.append(assistant_message(serialized_content))
-                        final_content = msg.content
-                        break
-                    elif msg.tool_calls:
-                        await self.handle_tools(msg.tool_calls)
-                if final_content is not None:
-                    self.is_final_answer = True
-                    if isinstance(final_content, str):
-                        self.final_answer_payload = final_content
-                    else:
-                        self.final_answer_payload = json.dumps(
-                            make_json_serializable(final_content)
-                        )
-                    assert self.final_answer_payload is not None
-                    return self.final_answer_payload
-
-                it += 1
-
-            self._log_event(ReporterEvent.MAX_ITERATIONS_REACHED, iterations=MAX_ITERATIONS)
-
-            failure_error = self._build_failure_error()
-            failure_payload = failure_error.as_dict()
-            self.history.append(assistant_message(failure_payload["message"]))
-            return failure_error.as_json()
-        finally:
-            await self._client.close()
+            final_content: str | list[dict[str, Any]] | None = None
+            for choice in response.choices:
+                msg = choice.message
+                if msg.content:
+                    self._log_event(
+                        ReporterEvent.REASONING,
+                        response_reasoning=msg.model_extra.get("reasoning", None) if msg.model_extra is not None else None,
+                    )
+                    self._log_event(ReporterEvent.MODEL_RESPONSE, content=msg.content)
+                    serialized_content = (
+                        msg.content
+                        if isinstance(msg.content, str)
+                        else dumps_serializable(msg.content)
+                    )
+                    self.history.append(assistant_message(serialized_content))
+                    final_content = msg.content
+                    break
+                elif msg.tool_calls:
+                    await self.handle_tools(msg.tool_calls)
+            if final_content is not None:
+                self.is_final_answer = True
+                if isinstance(final_content, str):
+                    self.final_answer_payload = final_content
+                else:
+                    self.final_answer_payload = dumps_serializable(final_content)
+                assert self.final_answer_payload is not None
+                return self.final_answer_payload
+
+            it += 1
+
+        self._log_event(ReporterEvent.MAX_ITERATIONS_REACHED, iterations=MAX_ITERATIONS)
+
+        failure_error = self._build_failure_error()
+        failure_payload = failure_error.as_dict()
+        self.history.append(assistant_message(failure_payload["message"]))
+        return failure_error.as_json()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client once the conversation is over."""
+
+        await self._client.close()
 
     async def handle_tools(self, tool_calls: List[ChatCompletionMessageFunctionToolCall | ChatCompletionMessageCustomToolCall]) -> str | None:
+        pending: List[tuple[ChatCompletionMessageFunctionToolCall, ToolCall, Any]] = []
         for tool_call in tool_calls:
             assert isinstance(tool_call, ChatCompletionMessageFunctionToolCall)
             raw_arguments = tool_call.function.arguments or "{}"
             try:
-                arguments = json.loads(raw_arguments)
+                arguments = _json.loads(raw_arguments)
             except json.JSONDecodeError:
                 arguments = raw_arguments
 
-            tool_name = tool_call.function.name
             tool_call_record = ToolCall.from_openai_tool_call(tool_call)
             self.tool_call_records.append(tool_call_record)
-            self.history.append(tool_call_record.as_message_param())
+            pending.append((tool_call, tool_call_record, arguments))
 
             self._log_event(
                 ReporterEvent.TOOL_CALL,
-                tool_name=tool_name,
+                tool_name=tool_call.function.name,
                 tool_call_id=tool_call.id,
                 arguments=arguments,
             )
 
-            tool = TOOLS.get(tool_name)
+        # Independent tool calls from the same turn run concurrently; results are
+        # appended to the history in the order the model requested them.
+        tool_responses = await asyncio.gather(
+            *(
+                self._execute_tool(tool_call.function.name, arguments)
+                for tool_call, _, arguments in pending
+            ),
+            return_exceptions=True,
+        )
 
-            if tool is None:
+        for (tool_call, tool_call_record, _), tool_response in zip(
+            pending, tool_responses, strict=True
+        ):
+            if isinstance(tool_response, BaseException):
+                if not isinstance(tool_response, Exception):
+                    raise tool_response
                 tool_response = LLMError(
-                    reason="unknown_tool",
-                    message=f"Unknown tool: {tool_name}",
-                    details={"tool_name": tool_name},
+                    reason="tool_execution_failed",
+                    message=str(tool_response),
+                    details={"tool_name": tool_call.function.name},
                 ).as_dict()
-            elif not isinstance(arguments, dict):
-                tool_response = LLMError(
-                    reason="invalid_arguments",
-                    message="Tool arguments must be a JSON object.",
-                ).as_dict()
-            else:
-                try:
-                    validated_args = tool.args_model(**arguments)
-                except ValidationError as exc:
-                    tool_response = LLMError(
-                        reason="invalid_tool_arguments",
-                        message="Invalid tool arguments.",
-                        details=exc.errors(),
-                    ).as_dict()
-                else:
-                    tool_response = await run(
-                        tool.callback, **validated_args.model_dump(exclude_none=True)
-                    )
-
-            if isinstance(tool_response, BaseModel):
-                loggable_response = tool_response.model_dump(exclude_none=True)
-            else:
-                loggable_response = tool_response
 
             tool_message = ToolMessage(
                 tool_call_id=tool_call.id,
                 content=tool_response,
             )
+            self.history.append(tool_call_record.as_message_param())
             self.history.append(tool_message.as_message_param())
 
-            self._log_event(
-                ReporterEvent.TOOL_RESULT,
-                tool_name=tool_name,
-                tool_call_id=tool_call.id,
-                response=loggable_response,
-            )
-            
+            # Large result sets were just serialized for the history; only convert them
+            # again when someone is listening.
+            if self._reporter is not None:
+                if isinstance(tool_response, BaseModel):
+                    loggable_response = tool_response.model_dump(exclude_none=True)
+                else:
+                    loggable_response = tool_response
+                self._log_event(
+                    ReporterEvent.TOOL_RESULT,
+                    tool_name=tool_call.function.name,
+                    tool_call_id=tool_call.id,
+                    response=loggable_response,
+                )
+
         return None
 
+    async def _execute_tool(self, tool_name: str, arguments: Any) -> Any:
+        tool = TOOLS.get(tool_name)
+
+        if tool is None:
+            return LLMError(
+                reason="unknown_tool",
+                message=f"Unknown tool: {tool_name}",
+                details={"tool_name": tool_name},
+            ).as_dict()
+        if not isinstance(arguments, dict):
+            return LLMError(
+                reason="invalid_arguments",
+                message="Tool arguments must be a JSON object.",
+            ).as_dict()
+
+        try:
+            validated_args = tool.validate(arguments)
+        except ValidationError as exc:
+            return LLMError(
+                reason="invalid_tool_arguments",
+                message="Invalid tool arguments.",
+                details=exc.errors(),
+            ).as_dict()
+
+        return await run(tool.callback, **validated_args.model_dump(exclude_none=True))
+
     def save_history(self, file_path: str | Path) -> None:
         """Persist the collected interaction history to a JSON file."""
 
         path = Path(file_path)
         payload = {
-            "history": make_json_serializable(self.history),
-            "tool_calls": make_json_serializable(self.tool_call_records),
+            "history": self.history,
+            "tool_calls": self.tool_call_records,
             "is_final_answer": self.is_final_answer,
-            "final_answer_payload": make_json_serializable(self.final_answer_payload),
+            "final_answer_payload": self.final_answer_payload,
         }
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as fp:
-            json.dump(payload, fp, indent=2)
+        path.write_text(dumps_serializable(payload, indent=True), encoding="utf-8")
 
     def _log_event(self, event: ReporterEvent, **payload: Any) -> None:
         self._report(event, payload)
@@ -235,10 +277,6 @@ class SearchAgent:
 
 # --- wrapper: run sync in executor, await async directly ---
 async def run(func, *args, **kwargs):
-    if asyncio.iscoroutinefunction(func):
+    if inspect.iscoroutinefunction(func):
         return await func(*args, **kwargs)
-    else:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None, functools.partial(func, *args, **kwargs)
-        )
+    return await asyncio.to_thread(func, *args, **kwargs)
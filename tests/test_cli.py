@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import io
+from typing import Any
+
+import pytest
+from openai import OpenAIError
+
+from nodepragagent import cli
+from nodepragagent.utils import read_stdin
+
+
+async def _collect_prompts() -> list[str]:
+    return [prompt async for prompt in cli._prompt_lines()]
+
+
+def test_piped_stdin_yields_stripped_non_empty_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli.sys, "stdin", io.StringIO("first\n\n   \n  second  \nthird"))
+
+    assert asyncio.run(_collect_prompts()) == ["first", "second", "third"]
+
+
+def test_piped_stdin_stops_at_exit_command(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli.sys, "stdin", io.StringIO("first\nQUIT\nignored\n"))
+
+    assert asyncio.run(_collect_prompts()) == ["first"]
+
+
+def test_read_stdin_forwards_reader_errors() -> None:
+    def closed() -> str:
+        raise EOFError
+
+    with pytest.raises(EOFError):
+        asyncio.run(read_stdin(closed))
+
+
+class _FakeAgent:
+    """Stands in for SearchAgent so batch mode can run without a model server."""
+
+    in_flight = 0
+    peak_in_flight = 0
+    closed = 0
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+
+    async def generate_from_messages(self, prompt: str, **kwargs: Any) -> str:
+        cls = type(self)
+        cls.in_flight += 1
+        cls.peak_in_flight = max(cls.peak_in_flight, cls.in_flight)
+        try:
+            # Later prompts finish first, so output order must come from the input order.
+            await asyncio.sleep(0.01 * (5 - int(prompt[-1])))
+            if prompt == "fail-3":
+                raise OpenAIError("model unavailable")
+            return f"answer to {prompt}"
+        finally:
+            cls.in_flight -= 1
+
+    async def aclose(self) -> None:
+        type(self).closed += 1
+
+
+@pytest.fixture
+def fake_agent(monkeypatch: pytest.MonkeyPatch) -> type[_FakeAgent]:
+    agent = type("FakeAgent", (_FakeAgent,), {})
+    monkeypatch.setattr(cli, "SearchAgent", agent)
+    return agent
+
+
+def test_batch_answers_in_input_order_with_bounded_concurrency(
+    fake_agent: type[_FakeAgent], capsys: pytest.CaptureFixture[str]
+) -> None:
+    asyncio.run(cli.main(["--batch", "--concurrency", "2", "p-1", "p-2", "fail-3", "p-4"]))
+
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        "[1] You> p-1",
+        "[1] Model> answer to p-1",
+        "[2] You> p-2",
+        "[2] Model> answer to p-2",
+        "[3] You> fail-3",
+        "[4] You> p-4",
+        "[4] Model> answer to p-4",
+    ]
+    assert "model unavailable" in captured.err
+    assert fake_agent.peak_in_flight == 2
+    assert fake_agent.closed == 4
+
+
+def test_batch_reads_prompts_from_piped_stdin(
+    fake_agent: type[_FakeAgent],
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(cli.sys, "stdin", io.StringIO("p-1\n\np-2\n"))
+
+    asyncio.run(cli.main(["--batch"]))
+
+    assert capsys.readouterr().out.splitlines() == [
+        "[1] You> p-1",
+        "[1] Model> answer to p-1",
+        "[2] You> p-2",
+        "[2] Model> answer to p-2",
+    ]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--batch", "--save-history", "history.json", "p-1"],
+        ["--batch", "--concurrency", "0", "p-1"],
+    ],
+)
+def test_batch_rejects_invalid_options(fake_agent: type[_FakeAgent], argv: list[str]) -> None:
+    with pytest.raises(SystemExit):
+        asyncio.run(cli.main(argv))
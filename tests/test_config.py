@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from nodepragagent.config import DeepSeekConfig, VLLMConfig, default_vllm_config
+
+
+def test_fields_are_read_from_the_environment_at_construction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("VLLM_BASE_URL", "http://vllm.internal:8000/v1")
+    monkeypatch.setenv("VLLM_MODEL", "test-model")
+    monkeypatch.delenv("VLLM_API_KEY", raising=False)
+
+    config = VLLMConfig()
+
+    assert config.base_url == "http://vllm.internal:8000/v1"
+    assert config.model == "test-model"
+    assert config.api_key == "EMPTY"
+
+
+def test_configs_are_frozen_and_slotted() -> None:
+    config = VLLMConfig(base_url="http://localhost/v1", api_key="key", model="m")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.model = "other"  # type: ignore[misc]
+    assert not hasattr(config, "__dict__")
+    assert config == VLLMConfig(base_url="http://localhost/v1", api_key="key", model="m")
+
+
+def test_non_string_values_are_rejected() -> None:
+    with pytest.raises(TypeError, match="VLLMConfig.base_url must be a string"):
+        VLLMConfig(base_url=123)  # type: ignore[arg-type]
+
+
+def test_deepseek_requires_an_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DEEPSEEK_API_KEY", raising=False)
+
+    with pytest.raises(ValueError, match="DEEPSEEK_API_KEY"):
+        DeepSeekConfig()
+
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "secret")
+    assert DeepSeekConfig().api_key == "secret"
+
+
+def test_default_vllm_config_is_built_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    default_vllm_config.cache_clear()
+    try:
+        first = default_vllm_config()
+        monkeypatch.setenv("VLLM_MODEL", "changed-after-first-use")
+        assert default_vllm_config() is first
+    finally:
+        default_vllm_config.cache_clear()
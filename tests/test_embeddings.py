@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+from nodepragagent import embeddings
+from nodepragagent.config import VLLMConfig
+
+CONFIG = VLLMConfig(base_url="http://localhost:1/v1", api_key="EMPTY", model="chat")
+
+
+class _FakeEndpoint:
+    """Replaces the HTTP call; records each batch and answers with len(text)."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.error: BaseException | None = None
+        self.vectors: list[Sequence[float]] | None = None
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(
+        self, texts: list[str], *, config: VLLMConfig, model: str, batch_size: int
+    ) -> list[Sequence[float]]:
+        self.batches.append(list(texts))
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        if self.vectors is not None:
+            return self.vectors
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.fixture
+def endpoint(monkeypatch: pytest.MonkeyPatch) -> _FakeEndpoint:
+    fake = _FakeEndpoint()
+    monkeypatch.setattr(embeddings, "_embed_async", fake)
+    monkeypatch.setattr(embeddings, "_batchers", {})
+    return fake
+
+
+def _batcher(**kwargs: Any) -> embeddings._EmbeddingBatcher:
+    return embeddings._EmbeddingBatcher(config=CONFIG, model="embed", **kwargs)
+
+
+def test_concurrent_queries_share_one_request(endpoint: _FakeEndpoint) -> None:
+    async def scenario() -> list[Sequence[float]]:
+        return await asyncio.gather(
+            *(
+                embeddings.embed_query(text, config=CONFIG, model="embed")
+                for text in ("a", "bb", "ccc")
+            )
+        )
+
+    assert asyncio.run(scenario()) == [[1.0], [2.0], [3.0]]
+    assert endpoint.batches == [["a", "bb", "ccc"]]
+
+
+def test_identical_texts_share_one_slot(endpoint: _FakeEndpoint) -> None:
+    async def scenario() -> list[Sequence[float]]:
+        batcher = _batcher()
+        return await asyncio.gather(batcher.embed("a"), batcher.embed("bb"), batcher.embed("a"))
+
+    assert asyncio.run(scenario()) == [[1.0], [2.0], [1.0]]
+    assert endpoint.batches == [["a", "bb"]]
+
+
+def test_recent_vectors_are_answered_from_memory(endpoint: _FakeEndpoint) -> None:
+    async def scenario() -> list[Sequence[float]]:
+        first = await embeddings.embed_query("a", config=CONFIG, model="embed")
+        again = await embeddings.embed_query("a", config=CONFIG, model="embed")
+        return [first, again]
+
+    assert asyncio.run(scenario()) == [[1.0], [1.0]]
+    assert endpoint.batches == [["a"]]
+
+
+def test_failed_vectors_are_not_remembered(endpoint: _FakeEndpoint) -> None:
+    endpoint.error = ConnectionError("endpoint down")
+    batcher = _batcher()
+
+    async def embed() -> Sequence[float]:
+        return await asyncio.wait_for(batcher.embed("a"), timeout=1)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(embed())
+    endpoint.error = None
+
+    assert asyncio.run(embed()) == [1.0]
+    assert endpoint.batches == [["a"], ["a"]]
+
+
+def test_full_batch_flushes_without_waiting_for_the_window(endpoint: _FakeEndpoint) -> None:
+    async def scenario() -> list[Sequence[float]]:
+        batcher = _batcher(max_batch=2, max_wait=60)
+        return await asyncio.wait_for(
+            asyncio.gather(batcher.embed("a"), batcher.embed("bb")), timeout=1
+        )
+
+    assert asyncio.run(scenario()) == [[1.0], [2.0]]
+    assert endpoint.batches == [["a", "bb"]]
+
+
+def test_failed_request_raises_for_every_caller(endpoint: _FakeEndpoint) -> None:
+    endpoint.error = ConnectionError("endpoint down")
+
+    async def scenario() -> tuple[list[Any], embeddings._EmbeddingBatcher]:
+        batcher = _batcher()
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True),
+            timeout=1,
+        )
+        return results, batcher
+
+    results, batcher = asyncio.run(scenario())
+    assert [type(result) for result in results] == [ConnectionError, ConnectionError]
+    assert batcher._waiting == {}
+
+
+def test_missing_vectors_raise_runtime_error(endpoint: _FakeEndpoint) -> None:
+    endpoint.vectors = []
+
+    async def scenario() -> None:
+        await asyncio.wait_for(_batcher().embed("a"), timeout=1)
+
+    with pytest.raises(RuntimeError, match="returned no data"):
+        asyncio.run(scenario())
+
+
+def test_cancelled_request_cancels_waiting_callers(endpoint: _FakeEndpoint) -> None:
+    endpoint.release.clear()
+
+    async def scenario() -> embeddings._EmbeddingBatcher:
+        batcher = _batcher(max_batch=1)
+        waiter = asyncio.ensure_future(batcher.embed("a"))
+        while not endpoint.batches:
+            await asyncio.sleep(0)
+        for task in batcher._in_flight:
+            task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(waiter, timeout=1)
+        return batcher
+
+    batcher = asyncio.run(scenario())
+    assert batcher._waiting == {}
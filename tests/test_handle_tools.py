@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+import time
+from typing import Any
+
+import pytest
+from openai.types.chat import ChatCompletionMessageFunctionToolCall
+from openai.types.chat.chat_completion_message_function_tool_call import Function
+from pydantic import BaseModel
+
+from nodepragagent import _json, tools, vllm
+from nodepragagent.config import VLLMConfig
+from nodepragagent.tools import REQUEST_USER_INPUT_TOOL, Tool
+
+
+class _EchoArgs(BaseModel):
+    value: str
+
+
+def _tool_call(call_id: str, name: str, arguments: str) -> ChatCompletionMessageFunctionToolCall:
+    return ChatCompletionMessageFunctionToolCall(
+        id=call_id,
+        type="function",
+        function=Function(name=name, arguments=arguments),
+    )
+
+
+def _tool_results(agent: vllm.SearchAgent) -> list[tuple[str, Any]]:
+    return [
+        (message["tool_call_id"], _json.loads(message["content"]))
+        for message in agent.history
+        if message["role"] == "tool"
+    ]
+
+
+def _run_handle_tools(
+    tools: dict[str, Tool], tool_calls: list[ChatCompletionMessageFunctionToolCall]
+) -> vllm.SearchAgent:
+    async def scenario() -> vllm.SearchAgent:
+        agent = vllm.SearchAgent(
+            config=VLLMConfig(base_url="http://localhost:1/v1", api_key="EMPTY", model="m"),
+            system_prompt="system",
+        )
+        try:
+            await agent.handle_tools(list(tool_calls))
+        finally:
+            await agent.aclose()
+        return agent
+
+    original = dict(vllm.TOOLS)
+    vllm.TOOLS.clear()
+    vllm.TOOLS.update(tools)
+    try:
+        return asyncio.run(scenario())
+    finally:
+        vllm.TOOLS.clear()
+        vllm.TOOLS.update(original)
+
+
+def test_tool_calls_run_concurrently_and_keep_request_order() -> None:
+    second_started = asyncio.Event()
+
+    async def slow(*, value: str) -> dict[str, Any]:
+        # Only finishes once the second call has started, so a sequential
+        # dispatcher would time out here.
+        await asyncio.wait_for(second_started.wait(), timeout=2)
+        return {"echo": value}
+
+    async def fast(*, value: str) -> dict[str, Any]:
+        second_started.set()
+        return {"echo": value}
+
+    agent = _run_handle_tools(
+        {
+            "slow": Tool(name="slow", description="", args_model=_EchoArgs, callback=slow),
+            "fast": Tool(name="fast", description="", args_model=_EchoArgs, callback=fast),
+        },
+        [
+            _tool_call("call-1", "slow", '{"value": "first"}'),
+            _tool_call("call-2", "fast", '{"value": "second"}'),
+        ],
+    )
+
+    assert _tool_results(agent) == [
+        ("call-1", {"echo": "first"}),
+        ("call-2", {"echo": "second"}),
+    ]
+    roles = [message["role"] for message in agent.history]
+    assert roles == ["system", "assistant", "tool", "assistant", "tool"]
+
+
+def test_sync_tools_are_dispatched_to_a_thread() -> None:
+    def sync_echo(*, value: str) -> dict[str, Any]:
+        return {"echo": value}
+
+    agent = _run_handle_tools(
+        {"echo": Tool(name="echo", description="", args_model=_EchoArgs, callback=sync_echo)},
+        [_tool_call("call-1", "echo", '{"value": "x"}')],
+    )
+
+    assert _tool_results(agent) == [("call-1", {"echo": "x"})]
+
+
+def test_tool_failures_are_mapped_to_llm_errors() -> None:
+    async def broken(*, value: str) -> dict[str, Any]:
+        raise ValueError(f"cannot handle {value}")
+
+    async def echo(*, value: str) -> dict[str, Any]:
+        return {"echo": value}
+
+    agent = _run_handle_tools(
+        {
+            "broken": Tool(name="broken", description="", args_model=_EchoArgs, callback=broken),
+            "echo": Tool(name="echo", description="", args_model=_EchoArgs, callback=echo),
+        },
+        [
+            _tool_call("call-1", "broken", '{"value": "x"}'),
+            _tool_call("call-2", "missing", "{}"),
+            _tool_call("call-3", "echo", '{"unexpected": 1}'),
+            _tool_call("call-4", "echo", "[1, 2]"),
+            _tool_call("call-5", "echo", '{"value": "ok"}'),
+        ],
+    )
+
+    results = dict(_tool_results(agent))
+    assert results["call-1"] == {
+        "type": "error",
+        "reason": "tool_execution_failed",
+        "message": "cannot handle x",
+        "details": {"tool_name": "broken"},
+    }
+    assert results["call-2"]["reason"] == "unknown_tool"
+    assert results["call-3"]["reason"] == "invalid_tool_arguments"
+    assert results["call-4"]["reason"] == "invalid_arguments"
+    # One failing call does not take the rest of the turn down with it.
+    assert results["call-5"] == {"echo": "ok"}
+
+
+def test_base_exceptions_from_tools_propagate() -> None:
+    async def interrupted(*, value: str) -> dict[str, Any]:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        _run_handle_tools(
+            {
+                "interrupted": Tool(
+                    name="interrupted", description="", args_model=_EchoArgs, callback=interrupted
+                )
+            },
+            [_tool_call("call-1", "interrupted", '{"value": "x"}')],
+        )
+
+
+class _Terminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+def test_user_input_requests_in_one_turn_are_asked_one_at_a_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    answers = iter(["Milan", "last week"])
+    prompts: list[str] = []
+    reading = 0
+    peak_reading = 0
+    guard = threading.Lock()
+
+    def fake_input(prompt: str) -> str:
+        nonlocal reading, peak_reading
+        with guard:
+            reading += 1
+            peak_reading = max(peak_reading, reading)
+            prompts.append(prompt)
+        # Gives a second, unserialized reader time to start before this one answers.
+        time.sleep(0.05)
+        with guard:
+            reading -= 1
+            return next(answers)
+
+    monkeypatch.setattr(tools.sys, "stdin", _Terminal())
+    monkeypatch.setattr("builtins.input", fake_input)
+
+    agent = _run_handle_tools(
+        {REQUEST_USER_INPUT_TOOL.name: REQUEST_USER_INPUT_TOOL},
+        [
+            _tool_call("call-1", "request_user_input", '{"prompt": "Which store?"}'),
+            _tool_call("call-2", "request_user_input", '{"prompt": "Which period?"}'),
+        ],
+    )
+
+    assert peak_reading == 1
+    assert prompts == ["Which store?\n> ", "Which period?\n> "]
+    assert _tool_results(agent) == [
+        ("call-1", {"response": "Milan"}),
+        ("call-2", {"response": "last week"}),
+    ]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from nodepragagent import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return str(request.param)
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+def _point_default(value: Any) -> Any:
+    if isinstance(value, _Point):
+        return {"x": value.x, "y": value.y}
+    raise TypeError(f"unsupported: {type(value).__name__}")
+
+
+def test_dumps_is_compact_and_keeps_unicode(backend: str) -> None:
+    assert _json.dumps({"name": "café", "items": [1, 2.5, None, True]}) == (
+        '{"name":"café","items":[1,2.5,null,true]}'
+    )
+
+
+def test_dumps_indent_and_sort_keys(backend: str) -> None:
+    assert _json.dumps({"b": 1, "a": [1]}, indent=True, sort_keys=True) == (
+        '{\n  "a": [\n    1\n  ],\n  "b": 1\n}'
+    )
+
+
+def test_dumps_stringifies_non_string_keys(backend: str) -> None:
+    assert _json.dumps({1: "one"}) == '{"1":"one"}'
+
+
+def test_dumps_sends_dataclasses_to_default(backend: str) -> None:
+    assert _json.dumps(_Point(1, 2), default=_point_default) == '{"x":1,"y":2}'
+
+
+def test_dumps_handles_integers_beyond_64_bits(backend: str) -> None:
+    assert _json.dumps({"big": 2**70}) == '{"big":1180591620717411303424}'
+
+
+def test_dumps_raises_type_error_for_unsupported_values(backend: str) -> None:
+    with pytest.raises(TypeError):
+        _json.dumps(object())
+
+
+def test_dumps_bytes_is_utf8(backend: str) -> None:
+    assert _json.dumps_bytes(["é"]) == '["é"]'.encode("utf-8")
+
+
+def test_loads_round_trips(backend: str) -> None:
+    payload = {"a": [1, 2.5, None, "x"], "b": {"c": False}}
+    assert _json.loads(_json.dumps(payload)) == payload
+    assert _json.loads(_json.dumps_bytes(payload)) == payload
+
+
+def test_loads_raises_json_decode_error(backend: str) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        _json.loads("{not json")
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import pytest
+
+from nodepragagent.logging_utils import log_operation
+
+LOGGER_NAME = "nodepragagent.tests.log_operation"
+
+
+def _operation(**kwargs: Any) -> Any:
+    return log_operation(
+        logger=logging.getLogger(LOGGER_NAME),
+        start_message="starting",
+        success_message="done",
+        failure_message="failed",
+        base_extra={"operation": "lookup"},
+        **kwargs,
+    )
+
+
+def _messages(caplog: pytest.LogCaptureFixture) -> list[tuple[int, str]]:
+    return [
+        (record.levelno, record.getMessage())
+        for record in caplog.records
+        if record.name == LOGGER_NAME
+    ]
+
+
+def test_info_logs_start_and_success_with_extra(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, logger=LOGGER_NAME)
+
+    with _operation(success_extra_fn=lambda response: {"rows": len(response)}) as context:
+        context.record_response([1, 2])
+
+    assert _messages(caplog) == [(logging.INFO, "starting"), (logging.INFO, "done")]
+    assert caplog.records[-1].rows == 2  # type: ignore[attr-defined]
+    assert caplog.records[-1].operation == "lookup"  # type: ignore[attr-defined]
+
+
+def test_success_is_skipped_when_info_is_disabled(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.WARNING, logger=LOGGER_NAME)
+
+    def never_called(response: Any) -> dict[str, Any]:
+        raise AssertionError("success extras are built only when INFO is enabled")
+
+    with _operation(success_extra_fn=never_called) as context:
+        assert context.record_response("value") == "value"
+
+    assert _messages(caplog) == []
+
+
+@pytest.mark.parametrize("level", [logging.INFO, logging.WARNING])
+def test_failures_log_at_error_and_propagate(
+    caplog: pytest.LogCaptureFixture, level: int
+) -> None:
+    caplog.set_level(level, logger=LOGGER_NAME)
+
+    with pytest.raises(ValueError):
+        with _operation():
+            raise ValueError("boom")
+
+    errors = [record for record in caplog.records if record.levelno == logging.ERROR]
+    assert [record.getMessage() for record in errors] == ["failed"]
+    assert errors[0].exc_info is not None
+    assert errors[0].operation == "lookup"  # type: ignore[attr-defined]
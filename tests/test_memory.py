@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+from nodepragagent import _json
+from nodepragagent.memory import _to_serializable, dumps_serializable
+
+
+class _Record:
+    def __init__(self, name: str, tags: tuple[str, ...]) -> None:
+        self.name = name
+        self.tags = tags
+
+
+@dataclass(slots=True)
+class _Slotted:
+    x: int
+    y: Any = None
+
+
+class _Model(BaseModel):
+    title: str
+    note: str | None = None
+
+
+def test_plain_json_is_copied_with_key_order() -> None:
+    payload = {"b": [1, 2.5, None, True], "a": {"z": "text", "y": []}}
+
+    result = _to_serializable(payload)
+
+    assert result == payload
+    assert list(result) == ["b", "a"]
+    assert list(result["a"]) == ["z", "y"]
+    assert result is not payload
+
+
+def test_tuples_become_lists_and_keys_become_strings() -> None:
+    assert _to_serializable({1: (1, (2, 3)), None: "x"}) == {"1": [1, [2, 3]], "None": "x"}
+
+
+def test_strings_are_not_reparsed() -> None:
+    assert _to_serializable({"raw": '{"a": 1}'}) == {"raw": '{"a": 1}'}
+
+
+def test_objects_are_converted_from_their_attributes() -> None:
+    result = _to_serializable([_Record("r", ("a",)), _Slotted(1, _Slotted(2))])
+
+    assert result == [
+        {"_type": "_Record", "name": "r", "tags": ["a"]},
+        {"_type": "_Slotted", "x": 1, "y": {"_type": "_Slotted", "x": 2, "y": None}},
+    ]
+
+
+def test_pydantic_models_dump_in_json_mode() -> None:
+    assert _to_serializable({"m": _Model(title="t")}) == {"m": {"title": "t"}}
+
+
+def test_unknown_values_fall_back_to_str() -> None:
+    assert _to_serializable({"c": 1j, "s": frozenset()}) == {"c": "1j", "s": "frozenset()"}
+
+
+def test_shared_references_share_one_copy() -> None:
+    shared = {"k": [1]}
+
+    result = _to_serializable({"first": shared, "second": shared})
+
+    assert result["first"] is result["second"]
+
+
+def test_deep_nesting_does_not_hit_the_recursion_limit() -> None:
+    payload: Any = "leaf"
+    depth = sys.getrecursionlimit() * 2
+    for _ in range(depth):
+        payload = {"child": [payload]}
+
+    result = _to_serializable(payload)
+
+    for _ in range(depth):
+        result = result["child"][0]
+    assert result == "leaf"
+
+
+def test_dumps_serializable_converts_foreign_values_through_the_hook() -> None:
+    payload = {"record": _Record("r", ("a",)), "slotted": _Slotted(1), "model": _Model(title="t")}
+
+    assert _json.loads(dumps_serializable(payload)) == {
+        "record": {"_type": "_Record", "name": "r", "tags": ["a"]},
+        "slotted": {"_type": "_Slotted", "x": 1, "y": None},
+        "model": {"title": "t"},
+    }
+
+
+def test_dumps_serializable_falls_back_to_the_walk_for_unsupported_keys() -> None:
+    assert _json.loads(dumps_serializable({(1, 2): "pair", 3: [_Slotted(4)]})) == {
+        "(1, 2)": "pair",
+        "3": [{"_type": "_Slotted", "x": 4, "y": None}],
+    }
+
+
+def test_dumps_serializable_handles_integers_beyond_64_bits() -> None:
+    assert dumps_serializable({"big": 2**70}) == '{"big":1180591620717411303424}'
+
+
+def test_dumps_serializable_indents() -> None:
+    assert dumps_serializable({"a": [1]}, indent=True) == '{\n  "a": [\n    1\n  ]\n}'
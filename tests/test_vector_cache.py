@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from nodepragagent.vector.cache import SemanticQueryCache, TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_semantic_cache_matches_similar_vectors_only() -> None:
+    cache: SemanticQueryCache[str] = SemanticQueryCache(threshold=0.95)
+    cache.put([1.0, 0.0], "scope", "hit")
+
+    # Scaled and slightly rotated queries are still the same direction.
+    assert cache.get([10.0, 0.0], "scope") == "hit"
+    assert cache.get([1.0, 0.1], "scope") == "hit"
+    assert cache.get([1.0, 1.0], "scope") is None
+
+
+def test_semantic_cache_returns_the_closest_entry() -> None:
+    cache: SemanticQueryCache[str] = SemanticQueryCache(threshold=0.9)
+    cache.put([1.0, 0.2], "scope", "near")
+    cache.put([1.0, 0.0], "scope", "exact")
+
+    assert cache.get([1.0, 0.0], "scope") == "exact"
+    assert cache.get([1.0, 0.25], "scope") == "near"
+
+
+def test_semantic_cache_keeps_scopes_apart() -> None:
+    cache: SemanticQueryCache[str] = SemanticQueryCache()
+    cache.put([1.0, 0.0], (3, ""), "three")
+
+    assert cache.get([1.0, 0.0], (5, "")) is None
+    assert cache.get([1.0, 0.0], (3, "")) == "three"
+
+
+def test_semantic_cache_ignores_zero_vectors() -> None:
+    cache: SemanticQueryCache[str] = SemanticQueryCache()
+    cache.put([0.0, 0.0], "scope", "zero")
+
+    assert cache.get([0.0, 0.0], "scope") is None
+
+
+def test_semantic_cache_entries_expire() -> None:
+    clock = _Clock()
+    cache: SemanticQueryCache[str] = SemanticQueryCache(ttl=10, clock=clock)
+    cache.put([1.0, 0.0], "scope", "value")
+
+    clock.now = 9.9
+    assert cache.get([1.0, 0.0], "scope") == "value"
+    clock.now = 10.0
+    assert cache.get([1.0, 0.0], "scope") is None
+
+
+def test_semantic_cache_evicts_least_recently_used() -> None:
+    cache: SemanticQueryCache[str] = SemanticQueryCache(maxsize=2)
+    cache.put([1.0, 0.0], "scope", "x")
+    cache.put([0.0, 1.0], "scope", "y")
+    assert cache.get([1.0, 0.0], "scope") == "x"
+
+    cache.put([-1.0, 0.0], "scope", "-x")
+
+    assert cache.get([0.0, 1.0], "scope") is None
+    assert cache.get([1.0, 0.0], "scope") == "x"
+    assert cache.get([-1.0, 0.0], "scope") == "-x"
+
+
+def test_ttl_cache_entries_expire() -> None:
+    clock = _Clock()
+    cache: TTLCache[str] = TTLCache(ttl=10, clock=clock)
+    cache.put("key", "value")
+
+    clock.now = 9.9
+    assert cache.get("key") == "value"
+    clock.now = 10.0
+    assert cache.get("key") is None
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache: TTLCache[int] = TTLCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_ttl_cache_put_refreshes_an_existing_key() -> None:
+    clock = _Clock()
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    clock.now = 5
+    cache.put("a", 10)
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    clock.now = 12
+    assert cache.get("a") == 10